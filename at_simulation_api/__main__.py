@@ -1,5 +1,6 @@
 import asyncio
 from contextlib import asynccontextmanager
+from functools import partial
 
 from at_simulation_api.config.cli_args import parse_args
 from at_simulation_api import utils
@@ -13,17 +14,27 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from at_simulation_api.client.auth_client import AuthClientSingleton
+from at_simulation_api.config.logger import application_logger as logger
+from at_simulation_api.config.processor import ProcessorStore
 from at_simulation_api.config.rabbitmq import RabbitMQStore
 from at_simulation_api.config.server import ServerConfigurator
+from at_simulation_api.config.translator import TranslatorStore
 from at_simulation_api.delivery.core.middleware.fastapi_exception_handler import (
     validation_exception_handler,
 )
 from at_simulation_api.delivery.core.middleware.logging import LoggingMiddleware
 from at_simulation_api.delivery.core.middleware.response import ResponseMiddleware
 from at_simulation_api.delivery.router import setup_routes
-from at_simulation_api.providers.model import get_model_service
+from at_simulation_api.providers.model import (
+    get_async_model_service,
+    get_model_service,
+)
 from at_simulation_api.providers.processor import get_processor_service
-from at_simulation_api.providers.translator import get_translator_service
+from at_simulation_api.providers.translator import (
+    get_translated_file_index,
+    get_translator_service,
+)
+from at_simulation_api.providers.worker import get_worker_executor
 from at_simulation_api.worker.worker import ATSimulationWorker
 
 
@@ -40,27 +51,52 @@ async def lifespan(app: FastAPI):
     rabbitmq_config = RabbitMQStore.get_rabbitmq_config()
     connection_parameters = ConnectionParameters(rabbitmq_config.url)
 
-    model_service = await utils.resolve_dependency(get_model_service)
-    translator_service = await utils.resolve_dependency(get_translator_service)
     processor_service = await utils.resolve_dependency(get_processor_service)
 
+    if TranslatorStore.get_translator_config().warm_up_on_startup:
+        # the warm-up only builds, so it needs no model service or DB session
+        translator_service = await utils.resolve_dependency(
+            get_translator_service, {get_async_model_service: None}
+        )
+        warm_up_time = await translator_service.warm_up()
+        logger.info(
+            "Translator warm-up finished",
+            extra={"details": {"warm_up_time": round(warm_up_time, 3)}},
+        )
+
     simulation_worker = ATSimulationWorker(
         connection_parameters=connection_parameters,
         auth_client=auth_client,
-        model_service=model_service,
-        translator_service=translator_service,
+        model_service_scope=partial(utils.resolve_scoped_dependency, get_model_service),
+        translator_service_scope=partial(
+            utils.resolve_scoped_dependency, get_translator_service
+        ),
         processor_service=processor_service,
+        executor=get_worker_executor(),
     )
 
     await simulation_worker.initialize()
     await simulation_worker.register()
 
     task = asyncio.create_task(simulation_worker.start())
+    reaper_task = asyncio.create_task(
+        processor_service.run_reaper(
+            ProcessorStore.get_processor_config().reap_interval
+        )
+    )
+    reconcile_task = asyncio.create_task(
+        get_translated_file_index().run_reconciliation(
+            TranslatorStore.get_translator_config().file_index_reconcile_interval
+        )
+    )
 
     try:
         yield
     finally:
         task.cancel()
+        reaper_task.cancel()
+        reconcile_task.cancel()
+        get_worker_executor().shutdown()
 
 app = FastAPI(title="AT_SIMULATION", version="1.0.0", lifespan=lifespan)
 app.add_middleware(LoggingMiddleware)
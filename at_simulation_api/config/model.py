@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ModelConfig(BaseSettings):
+    model_cache_max_size: int = Field(alias="MODEL_CACHE_MAX_SIZE", default=256)
+
+    class Config:
+        extra = "allow"
+
+
+class ModelStore:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_model_config(cls) -> ModelConfig:
+        return ModelConfig()
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal, Union
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -11,10 +12,24 @@ class DatabaseConfig(BaseSettings):
     user: str = Field(..., alias="DB_USER")
     password: str = Field(..., alias="DB_PASS")
 
+    pool_size: int = Field(alias="DB_POOL_SIZE", default=5)
+    max_overflow: int = Field(alias="DB_MAX_OVERFLOW", default=10)
+    pool_timeout: float = Field(alias="DB_POOL_TIMEOUT", default=30.0)
+    pool_recycle: int = Field(alias="DB_POOL_RECYCLE", default=1800)
+    pool_pre_ping: bool = Field(alias="DB_POOL_PRE_PING", default=True)
+    # True logs statements, "debug" also logs result rows
+    echo: Union[bool, Literal["debug"]] = Field(alias="DB_ECHO", default=False)
+    # load models for the async translator paths through asyncpg
+    async_enabled: bool = Field(alias="DB_ASYNC_ENABLED", default=False)
+
     @property
     def url(self) -> str:
         return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    @property
+    def async_url(self) -> str:
+        return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
     class Config:
         extra = "allow"
 
@@ -0,0 +1,42 @@
+import os
+import tempfile
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ProcessorConfig(BaseSettings):
+    executable_cache_dir: str = Field(
+        alias="PROCESSOR_EXECUTABLE_CACHE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "at_simulation", "executables"),
+    )
+    executable_cache_max_size: int = Field(
+        alias="PROCESSOR_EXECUTABLE_CACHE_MAX_SIZE",
+        default=1024 * 1024 * 1024,
+    )
+    max_concurrent_creates: int = Field(
+        alias="PROCESSOR_MAX_CONCURRENT_CREATES",
+        default=4,
+    )
+    # longest stdout line a process may print, ticks are one JSON line each
+    stream_limit: int = Field(
+        alias="PROCESSOR_STREAM_LIMIT",
+        default=16 * 1024 * 1024,
+    )
+    # seconds a killed or exited process stays listed
+    finished_process_ttl: int = Field(
+        alias="PROCESSOR_FINISHED_PROCESS_TTL",
+        default=10 * 60,
+    )
+    reap_interval: int = Field(alias="PROCESSOR_REAP_INTERVAL", default=30)
+
+    class Config:
+        extra = "allow"
+
+
+class ProcessorStore:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_processor_config(cls) -> ProcessorConfig:
+        return ProcessorConfig()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TranslatorConfig(BaseSettings):
+    compile_cache_dir: str = Field(
+        alias="TRANSLATOR_COMPILE_CACHE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "at_simulation", "compile_cache"),
+    )
+    compile_cache_max_size: int = Field(
+        alias="TRANSLATOR_COMPILE_CACHE_MAX_SIZE",
+        default=1024 * 1024 * 1024,
+    )
+    max_concurrent_builds: int = Field(
+        alias="TRANSLATOR_MAX_CONCURRENT_BUILDS",
+        default=os.cpu_count() or 1,
+    )
+    job_ttl: int = Field(alias="TRANSLATOR_JOB_TTL", default=60 * 60)
+    max_batch_size: int = Field(alias="TRANSLATOR_MAX_BATCH_SIZE", default=100)
+    files_page_size: int = Field(alias="TRANSLATOR_FILES_PAGE_SIZE", default=100)
+    max_files_page_size: int = Field(
+        alias="TRANSLATOR_MAX_FILES_PAGE_SIZE",
+        default=1000,
+    )
+    fragment_memo_size: int = Field(
+        alias="TRANSLATOR_FRAGMENT_MEMO_SIZE",
+        default=50_000,
+    )
+    go_cache_dir: str = Field(
+        alias="TRANSLATOR_GO_CACHE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "at_simulation", "go_build"),
+    )
+    lint_cache_dir: str = Field(
+        alias="TRANSLATOR_LINT_CACHE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "at_simulation", "golangci_lint"),
+    )
+    warm_up_on_startup: bool = Field(
+        alias="TRANSLATOR_WARM_UP_ON_STARTUP",
+        default=True,
+    )
+    template_bytecode_cache_dir: Optional[str] = Field(
+        alias="TRANSLATOR_TEMPLATE_BYTECODE_CACHE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "at_simulation", "jinja"),
+    )
+    precompiled_templates_dir: Optional[str] = Field(
+        alias="TRANSLATOR_PRECOMPILED_TEMPLATES_DIR",
+        default=None,
+    )
+    # seconds between file index reconciliations, 0 runs it only on startup
+    file_index_reconcile_interval: int = Field(
+        alias="TRANSLATOR_FILE_INDEX_RECONCILE_INTERVAL",
+        default=60 * 60,
+    )
+
+    class Config:
+        extra = "allow"
+
+
+class TranslatorStore:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_translator_config(cls) -> TranslatorConfig:
+        return TranslatorConfig()
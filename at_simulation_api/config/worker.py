@@ -0,0 +1,26 @@
+import os
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class WorkerConfig(BaseSettings):
+    thread_pool_size: int = Field(
+        alias="WORKER_THREAD_POOL_SIZE",
+        default=min(32, (os.cpu_count() or 1) + 4),
+    )
+    max_concurrent_calls: int = Field(
+        alias="WORKER_MAX_CONCURRENT_CALLS",
+        default=min(32, (os.cpu_count() or 1) + 4),
+    )
+
+    class Config:
+        extra = "allow"
+
+
+class WorkerStore:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_worker_config(cls) -> WorkerConfig:
+        return WorkerConfig()
@@ -17,16 +17,20 @@ class ResponseHelper:
     # TODO: ERROR_DETAILS = "data" -> ERROR_DETAILS = "error_details"
     ERROR_DETAILS = "data"
     DATA = "data"
+    # set by routes that stream one JSON item per chunk, "data" becomes a list
+    STREAM_ARRAY_HEADER = "x-stream-array"
 
     @staticmethod
     async def wrap_stream_with_metadata(
-        original_stream: AsyncIterator[bytes], metadata: dict
+        original_stream: AsyncIterator[bytes], metadata: dict, as_array: bool = False
     ) -> AsyncIterator[bytes]:
         yield b"{\n"
         yield f'"{ResponseHelper.STATUS_CODE}": {metadata[ResponseHelper.STATUS_CODE]},\n'.encode()
         yield f'"{ResponseHelper.IS_ERROR}": {json.dumps(metadata[ResponseHelper.IS_ERROR])},\n'.encode()
         yield f'"{ResponseHelper.ERROR_MESSAGE}": {json.dumps(metadata[ResponseHelper.ERROR_MESSAGE])},\n'.encode()
         yield f'"{ResponseHelper.DATA}":\n'.encode()
+        if as_array:
+            yield b"[\n"
 
         first_chunk = True
         async for chunk in original_stream:
@@ -35,6 +39,8 @@ class ResponseHelper:
             yield chunk
             first_chunk = False
 
+        if as_array:
+            yield b"\n]"
         yield b"\n}"
 
 
@@ -48,7 +54,9 @@ class ResponseMiddleware(BaseHTTPMiddleware):
             if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
                 return response
 
-            if isinstance(response, StreamingResponse):
+            # call_next hands back a streaming response whose class depends on
+            # the Starlette version, so look for the body iterator instead
+            if hasattr(response, "body_iterator"):
                 metadata = {
                     ResponseHelper.STATUS_CODE: response.status_code,
                     ResponseHelper.IS_ERROR: False,
@@ -57,6 +65,7 @@ class ResponseMiddleware(BaseHTTPMiddleware):
                 wrapped_stream = ResponseHelper.wrap_stream_with_metadata(
                     response.body_iterator,
                     metadata,
+                    ResponseHelper.STREAM_ARRAY_HEADER in response.headers,
                 )
                 return StreamingResponse(
                     wrapped_stream,
@@ -65,7 +74,8 @@ class ResponseMiddleware(BaseHTTPMiddleware):
                     headers={
                         k: v
                         for k, v in response.headers.items()
-                        if k.lower() != "content-length"
+                        if k.lower()
+                        not in ("content-length", ResponseHelper.STREAM_ARRAY_HEADER)
                     },
                 )
 
@@ -16,4 +16,4 @@ class IFunctionService(Protocol):
     def delete_function(self, function_id: int, model_id: int) -> int: ...
 
 
-_: IFunctionService = FunctionService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IFunctionService = FunctionService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -16,4 +16,4 @@ class IImportService(Protocol):
     def delete_import(self, import_id: int, model_id: int) -> int: ...
 
 
-_: IImportService = ImportService(...)  # type: ignore[arg-type, reportArgumentType]
+_: IImportService = ImportService(..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -31,4 +31,4 @@ class IResourceService(Protocol):
     def delete_resource(self, resource_id: int, model_id: int) -> int: ...
 
 
-_: IResourceService = ResourceService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IResourceService = ResourceService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -48,4 +48,4 @@ class ITemplateService(Protocol):
     def delete_template_usage(self, template_usage_id: int, model_id: int) -> int: ...
 
 
-_: ITemplateService = TemplateService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: ITemplateService = TemplateService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
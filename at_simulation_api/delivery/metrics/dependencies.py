@@ -0,0 +1,30 @@
+from typing import Protocol
+
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.repository.local_cache.repository import LocalFileCache
+from at_simulation_api.service.executable_cache.service import ExecutableCache
+from at_simulation_api.storage.postgres.pool import InstrumentedQueuePool, PoolStats
+from at_simulation_api.worker.executor import WorkerExecutor
+from at_simulation_api.worker.models.models import WorkerStatsDict
+
+
+class ICacheStatsProvider(Protocol):
+    def get_stats(self) -> CacheStats: ...
+
+
+_: ICacheStatsProvider = LocalFileCache(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: ICacheStatsProvider = ExecutableCache(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IPoolStatsProvider(Protocol):
+    def get_stats(self) -> PoolStats: ...
+
+
+_: IPoolStatsProvider = InstrumentedQueuePool(...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IWorkerStatsProvider(Protocol):
+    def get_stats(self) -> WorkerStatsDict: ...
+
+
+_: IWorkerStatsProvider = WorkerExecutor(..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -0,0 +1,41 @@
+from at_simulation_api.delivery.metrics.models.models import (
+    CacheStatsResponse,
+    PoolStatsResponse,
+    WorkerStatsResponse,
+)
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.storage.postgres.pool import PoolStats
+from at_simulation_api.worker.models.models import WorkerStatsDict
+
+
+def to_CacheStatsResponse(stats: CacheStats) -> CacheStatsResponse:
+    return CacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        entries=stats.entries,
+        size=stats.size,
+        max_size=stats.max_size,
+    )
+
+
+def to_PoolStatsResponse(stats: PoolStats) -> PoolStatsResponse:
+    return PoolStatsResponse(
+        size=stats.size,
+        checked_in=stats.checked_in,
+        checked_out=stats.checked_out,
+        overflow=stats.overflow,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        wait_time_total=stats.wait_time_total,
+        wait_time_max=stats.wait_time_max,
+    )
+
+
+def to_WorkerStatsResponse(stats: WorkerStatsDict) -> WorkerStatsResponse:
+    return WorkerStatsResponse(
+        queued=stats["queued"],
+        in_flight=stats["in_flight"],
+        max_concurrent_calls=stats["max_concurrent_calls"],
+        completed=stats["completed"],
+        failed=stats["failed"],
+    )
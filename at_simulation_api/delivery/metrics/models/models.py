@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class PoolStatsResponse(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+class WorkerStatsResponse(BaseModel):
+    queued: int
+    in_flight: int
+    max_concurrent_calls: int
+    completed: int
+    failed: int
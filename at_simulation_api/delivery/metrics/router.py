@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends
+
+from at_simulation_api.delivery.metrics.dependencies import (
+    ICacheStatsProvider,
+    IPoolStatsProvider,
+    IWorkerStatsProvider,
+)
+from at_simulation_api.delivery.metrics.models.conversions import (
+    to_CacheStatsResponse,
+    to_PoolStatsResponse,
+    to_WorkerStatsResponse,
+)
+from at_simulation_api.delivery.metrics.models.models import (
+    CacheStatsResponse,
+    PoolStatsResponse,
+    WorkerStatsResponse,
+)
+from at_simulation_api.delivery.model.dependencies import get_current_user
+from at_simulation_api.providers.processor import get_executable_cache
+from at_simulation_api.providers.translator import get_compile_cache
+from at_simulation_api.providers.worker import get_worker_executor
+from at_simulation_api.storage.postgres.storage import get_db_pool
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+    # cache keys, pool and worker load are not for anonymous callers
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@router.get("/compile-cache", response_model=CacheStatsResponse)
+def get_compile_cache_stats(
+    compile_cache: ICacheStatsProvider = Depends(get_compile_cache),
+) -> CacheStatsResponse:
+    return to_CacheStatsResponse(compile_cache.get_stats())
+
+
+@router.get("/executable-cache", response_model=CacheStatsResponse)
+def get_executable_cache_stats(
+    executable_cache: ICacheStatsProvider = Depends(get_executable_cache),
+) -> CacheStatsResponse:
+    return to_CacheStatsResponse(executable_cache.get_stats())
+
+
+@router.get("/db-pool", response_model=PoolStatsResponse)
+def get_db_pool_stats(
+    db_pool: IPoolStatsProvider = Depends(get_db_pool),
+) -> PoolStatsResponse:
+    return to_PoolStatsResponse(db_pool.get_stats())
+
+
+@router.get("/worker", response_model=WorkerStatsResponse)
+def get_worker_stats(
+    executor: IWorkerStatsProvider = Depends(get_worker_executor),
+) -> WorkerStatsResponse:
+    return to_WorkerStatsResponse(executor.get_stats())
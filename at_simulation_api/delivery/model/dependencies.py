@@ -23,7 +23,7 @@ class IModelService(Protocol):
     def delete_model(self, model_id: int, user_id: int) -> int: ...
 
 
-_: IModelService = ModelService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IModelService = ModelService(..., ..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 async def get_current_user(
@@ -21,6 +21,7 @@ def to_ModelMetaResponse(model: ModelMetaDB) -> ModelMetaResponse:
         id=model.id,
         name=model.name,
         created_at=model.created_at,
+        revision=model.revision,
     )
 
 
@@ -12,6 +12,7 @@ class ModelMetaRequest(BaseModel):
 class ModelMetaResponse(ModelMetaRequest):
     id: int
     created_at: datetime
+    revision: int
 
 
 class ModelMetasResponse(BaseModel):
@@ -5,7 +5,7 @@ from at_simulation_api.service.processor.service import ProcessorService
 
 
 class IProcessorService(Protocol):
-    def create_process(
+    async def create_process(
         self, user_id: int, file_uuid: str, process_name: str
     ) -> Process: ...
 
@@ -13,11 +13,11 @@ class IProcessorService(Protocol):
         self, user_id: int, process_id: str, ticks: int, delay: int
     ) -> Process: ...
 
-    def pause_process(self, user_id: int, process_id: str) -> Process: ...
+    async def pause_process(self, user_id: int, process_id: str) -> Process: ...
 
-    def kill_process(self, user_id: int, process_id: str) -> Process: ...
+    async def kill_process(self, user_id: int, process_id: str) -> Process: ...
 
     def get_processes(self, user_id: int) -> List[Process]: ...
 
 
-_: IProcessorService = ProcessorService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IProcessorService = ProcessorService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
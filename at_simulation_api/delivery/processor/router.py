@@ -26,13 +26,15 @@ router = APIRouter(
 
 
 @router.post("", response_model=ProcessResponse)
-def create_process(
+async def create_process(
     body: CreateProcessRequest,
     user_id: int = Depends(get_current_user),
     processor_service: IProcessorService = Depends(get_processor_service),
 ) -> ProcessResponse:
     return to_ProcessResponse(
-        processor_service.create_process(user_id, body.file_id, body.process_name)
+        await processor_service.create_process(
+            user_id, body.file_id, body.process_name
+        )
     )
 
 
@@ -55,21 +57,25 @@ async def run_process(
 
 
 @router.post("/{process_id}/pause", response_model=ProcessResponse)
-def pause_process(
+async def pause_process(
     process_id: str,
     user_id: int = Depends(get_current_user),
     processor_service: IProcessorService = Depends(get_processor_service),
 ) -> ProcessResponse:
-    return to_ProcessResponse(processor_service.pause_process(user_id, process_id))
+    return to_ProcessResponse(
+        await processor_service.pause_process(user_id, process_id)
+    )
 
 
 @router.post("/{process_id}/kill", response_model=ProcessResponse)
-def kill_process(
+async def kill_process(
     process_id: str,
     user_id: int = Depends(get_current_user),
     processor_service: IProcessorService = Depends(get_processor_service),
 ) -> ProcessResponse:
-    return to_ProcessResponse(processor_service.kill_process(user_id, process_id))
+    return to_ProcessResponse(
+        await processor_service.kill_process(user_id, process_id)
+    )
 
 
 @router.get("", response_model=ProcessesResponse)
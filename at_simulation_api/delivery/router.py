@@ -1,6 +1,7 @@
 from fastapi import APIRouter, FastAPI
 
 from .editor.router import router as editor_router
+from .metrics.router import router as metrics_router
 from .model.router import router as model_router
 from .processor.router import router as processor_router
 from .translator.router import router as translator_router
@@ -17,4 +18,5 @@ def setup_routes(app: FastAPI):
     _router.include_router(visio_router)
     _router.include_router(translator_router)
     _router.include_router(processor_router)
+    _router.include_router(metrics_router)
     app.include_router(_router)
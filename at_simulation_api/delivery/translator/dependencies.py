@@ -1,16 +1,32 @@
-from typing import List, Protocol
+from typing import AsyncIterator, List, Optional, Protocol
 
-from at_simulation_api.repository.minio.models.models import MinioFile
-from at_simulation_api.service.translator.models.models import TranslateInfo
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
+from at_simulation_api.service.translator.models.models import (
+    BatchTranslationItem,
+    TranslateInfo,
+    TranslationJob,
+)
 from at_simulation_api.service.translator.service import TranslatorService
 
 
 class ITranslatorService(Protocol):
-    def translate_model(
+    async def translate_model(
         self, model_id: int, user_id: int, file_name: str
     ) -> TranslateInfo: ...
 
-    def get_translated_files(self, user_id: int) -> List[MinioFile]: ...
+    async def translate_models(
+        self, model_ids: List[int], user_id: int, file_name: str
+    ) -> AsyncIterator[BatchTranslationItem]: ...
+
+    async def submit_translation(
+        self, model_id: int, user_id: int, file_name: str
+    ) -> TranslationJob: ...
+
+    def get_translation_job(self, job_id: str, user_id: int) -> TranslationJob: ...
+
+    def get_translated_files(
+        self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TranslatedFilesPage: ...
 
 
-_: ITranslatorService = TranslatorService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: ITranslatorService = TranslatorService(..., ..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -1,12 +1,17 @@
-from typing import List
-
 from at_simulation_api.delivery.translator.models.models import (
+    BatchTranslateItemResponse,
     TranslatedFileResponse,
     TranslatedFilesResponse,
     TranslateResponse,
+    TranslationJobResponse,
 )
 from at_simulation_api.repository.minio.models.models import MinioFile
-from at_simulation_api.service.translator.models.models import TranslateInfo
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
+from at_simulation_api.service.translator.models.models import (
+    BatchTranslationItem,
+    TranslateInfo,
+    TranslationJob,
+)
 
 
 def to_TranslatedFileResponse(file: MinioFile) -> TranslatedFileResponse:
@@ -19,13 +24,11 @@ def to_TranslatedFileResponse(file: MinioFile) -> TranslatedFileResponse:
     )
 
 
-def to_TranslatedFilesResponse(files: List[MinioFile]) -> TranslatedFilesResponse:
-    sorted_files = sorted(
-        files, key=lambda file: file.file_meta.created_at, reverse=True
-    )
+def to_TranslatedFilesResponse(page: TranslatedFilesPage) -> TranslatedFilesResponse:
     return TranslatedFilesResponse(
-        files=[to_TranslatedFileResponse(file) for file in sorted_files],
-        total=len(sorted_files),
+        files=[to_TranslatedFileResponse(file) for file in page.files],
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -35,4 +38,27 @@ def to_TranslateResponse(info: TranslateInfo) -> TranslateResponse:
         file_content=info.file_content,
         translate_logs=info.translate_logs,
         stage=info.stage,
+        stage_timings=info.stage_timings,
+    )
+
+
+def to_BatchTranslateItemResponse(
+    item: BatchTranslationItem,
+) -> BatchTranslateItemResponse:
+    return BatchTranslateItemResponse(
+        model_id=item.model_id,
+        result=to_TranslateResponse(item.result) if item.result else None,
+        error=item.error,
+    )
+
+
+def to_TranslationJobResponse(job: TranslationJob) -> TranslationJobResponse:
+    return TranslationJobResponse(
+        id=job.job_id,
+        model_id=job.model_id,
+        status=job.status,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        result=to_TranslateResponse(job.result) if job.result else None,
+        error=job.error,
     )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -15,6 +15,7 @@ class TranslatedFileResponse(BaseModel):
 class TranslatedFilesResponse(BaseModel):
     files: List[TranslatedFileResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class TranslateResponse(BaseModel):
@@ -22,7 +23,29 @@ class TranslateResponse(BaseModel):
     file_content: str
     translate_logs: str
     stage: str
+    stage_timings: Dict[str, float] = {}
 
 
 class TranslateModelRequest(BaseModel):
     name: str
+
+
+class BatchTranslateRequest(BaseModel):
+    model_ids: List[int]
+    name: str
+
+
+class BatchTranslateItemResponse(BaseModel):
+    model_id: int
+    result: Optional[TranslateResponse] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class TranslationJobResponse(BaseModel):
+    id: str
+    model_id: int
+    status: str
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[TranslateResponse] = None
+    error: Optional[Dict[str, Any]] = None
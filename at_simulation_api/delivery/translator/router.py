@@ -1,17 +1,26 @@
+from typing import AsyncIterator, Optional
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
+from at_simulation_api.delivery.core.middleware.response import ResponseHelper
 from at_simulation_api.delivery.model.dependencies import get_current_user
 from at_simulation_api.delivery.translator.dependencies import ITranslatorService
 from at_simulation_api.delivery.translator.models.conversions import (
+    to_BatchTranslateItemResponse,
     to_TranslatedFilesResponse,
     to_TranslateResponse,
+    to_TranslationJobResponse,
 )
 from at_simulation_api.delivery.translator.models.models import (
+    BatchTranslateRequest,
     TranslatedFilesResponse,
     TranslateModelRequest,
     TranslateResponse,
+    TranslationJobResponse,
 )
 from at_simulation_api.providers.translator import get_translator_service
+from at_simulation_api.service.translator.models.models import BatchTranslationItem
 
 router = APIRouter(
     prefix="/translator",
@@ -20,11 +29,15 @@ router = APIRouter(
 
 
 @router.get("/files", response_model=TranslatedFilesResponse)
-async def get_translated_files(
+def get_translated_files(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     user_id: int = Depends(get_current_user),
     translator_service: ITranslatorService = Depends(get_translator_service),
 ) -> TranslatedFilesResponse:
-    return to_TranslatedFilesResponse(translator_service.get_translated_files(user_id))
+    return to_TranslatedFilesResponse(
+        translator_service.get_translated_files(user_id, limit, cursor)
+    )
 
 
 @router.post("/files/{model_id}", response_model=TranslateResponse)
@@ -35,5 +48,51 @@ async def translate_model(
     translator_service: ITranslatorService = Depends(get_translator_service),
 ) -> TranslateResponse:
     return to_TranslateResponse(
-        translator_service.translate_model(model_id, user_id, body.name)
+        await translator_service.translate_model(model_id, user_id, body.name)
+    )
+
+
+@router.post("/batch")
+async def translate_models(
+    body: BatchTranslateRequest,
+    user_id: int = Depends(get_current_user),
+    translator_service: ITranslatorService = Depends(get_translator_service),
+) -> StreamingResponse:
+    items = await translator_service.translate_models(
+        body.model_ids, user_id, body.name
+    )
+    return StreamingResponse(
+        _stream_batch_items(items),
+        media_type="application/json",
+        headers={ResponseHelper.STREAM_ARRAY_HEADER: "1"},
+    )
+
+
+async def _stream_batch_items(
+    items: AsyncIterator[BatchTranslationItem],
+) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield to_BatchTranslateItemResponse(item).model_dump_json().encode()
+
+
+@router.post("/jobs/{model_id}", response_model=TranslationJobResponse)
+async def submit_translation(
+    body: TranslateModelRequest,
+    model_id: int,
+    user_id: int = Depends(get_current_user),
+    translator_service: ITranslatorService = Depends(get_translator_service),
+) -> TranslationJobResponse:
+    return to_TranslationJobResponse(
+        await translator_service.submit_translation(model_id, user_id, body.name)
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=TranslationJobResponse)
+async def get_translation_job(
+    job_id: str,
+    user_id: int = Depends(get_current_user),
+    translator_service: ITranslatorService = Depends(get_translator_service),
+) -> TranslationJobResponse:
+    return to_TranslationJobResponse(
+        translator_service.get_translation_job(job_id, user_id)
     )
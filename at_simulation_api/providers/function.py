@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from at_simulation_api.providers.model_cache import get_model_cache
 from at_simulation_api.providers.visio import get_visio_service
 from at_simulation_api.repository.editor.function.repository import FunctionRepository
 from at_simulation_api.service.editor.function.service import FunctionService
@@ -14,5 +15,6 @@ def get_function_repository(session: Session = Depends(get_db)) -> FunctionRepos
 def get_function_service(
     function_rep=Depends(get_function_repository),
     visio_service=Depends(get_visio_service),
+    model_cache=Depends(get_model_cache),
 ) -> FunctionService:
-    return FunctionService(function_rep, visio_service)
+    return FunctionService(function_rep, visio_service, model_cache)
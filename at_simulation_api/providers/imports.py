@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from at_simulation_api.providers.model_cache import get_model_cache
 from at_simulation_api.repository.editor.imports.repository import ImportRepository
 from at_simulation_api.service.editor.imports.service import ImportService
 from at_simulation_api.storage.postgres.storage import get_db
@@ -12,5 +13,6 @@ def get_import_repository(session: Session = Depends(get_db)) -> ImportRepositor
 
 def get_import_service(
     import_rep=Depends(get_import_repository),
+    model_cache=Depends(get_model_cache),
 ) -> ImportService:
-    return ImportService(import_rep)
+    return ImportService(import_rep, model_cache)
@@ -1,11 +1,20 @@
+from typing import Callable, Union
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from at_simulation_api.config.postgres import PostgresStore
 from at_simulation_api.providers.function import get_function_service
+from at_simulation_api.providers.model_cache import get_model_cache
 from at_simulation_api.providers.resource import get_resource_service
 from at_simulation_api.providers.template import get_template_service
 from at_simulation_api.repository.model.repository import ModelRepository
+from at_simulation_api.service.model.async_service import (
+    AsyncModelService,
+    ThreadedModelService,
+)
 from at_simulation_api.service.model.service import ModelService
+from at_simulation_api.storage.postgres.async_storage import get_async_session_factory
 from at_simulation_api.storage.postgres.storage import get_db
 
 
@@ -18,10 +27,34 @@ def get_model_service(
     resource_service=Depends(get_resource_service),
     template_service=Depends(get_template_service),
     function_service=Depends(get_function_service),
+    model_cache=Depends(get_model_cache),
 ) -> ModelService:
     return ModelService(
         model_rep,
         resource_service,
         template_service,
         function_service,
+        model_cache,
     )
+
+
+def get_threaded_model_service(
+    model_service: ModelService = Depends(get_model_service),
+) -> ThreadedModelService:
+    return ThreadedModelService(model_service)
+
+
+def get_native_async_model_service(
+    model_cache=Depends(get_model_cache),
+) -> AsyncModelService:
+    return AsyncModelService(get_async_session_factory(), model_cache)
+
+
+# picked once, so a request only opens the session type the mode uses
+get_async_model_service: Callable[
+    ..., Union[AsyncModelService, ThreadedModelService]
+] = (
+    get_native_async_model_service
+    if PostgresStore.get_database_config().async_enabled
+    else get_threaded_model_service
+)
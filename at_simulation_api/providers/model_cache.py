@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from at_simulation_api.config.model import ModelStore
+from at_simulation_api.service.model.cache import ModelCache
+
+
+@lru_cache(maxsize=1)
+def get_model_cache() -> ModelCache:
+    return ModelCache(ModelStore.get_model_config().model_cache_max_size)
@@ -1,15 +1,44 @@
+from functools import lru_cache
+
 from fastapi import Depends
 
+from at_simulation_api.config.processor import ProcessorStore
 from at_simulation_api.providers.minio import get_minio_repository
 from at_simulation_api.providers.websocket_manager import get_websocket_manager
+from at_simulation_api.repository.local_cache.repository import LocalFileCache
+from at_simulation_api.repository.minio.repository import MinioRepository
+from at_simulation_api.service.executable_cache.service import ExecutableCache
+from at_simulation_api.service.processor.registry import ProcessRegistry
 from at_simulation_api.service.processor.service import ProcessorService
+from at_simulation_api.storage.minio.storage import get_minio_storage
+
+
+@lru_cache(maxsize=1)
+def get_executable_cache() -> ExecutableCache:
+    config = ProcessorStore.get_processor_config()
+    client, bucket_name = get_minio_storage()
+    return ExecutableCache(
+        LocalFileCache(
+            config.executable_cache_dir, config.executable_cache_max_size
+        ),
+        MinioRepository(client, bucket_name),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_process_registry() -> ProcessRegistry:
+    return ProcessRegistry(ProcessorStore.get_processor_config().finished_process_ttl)
 
 
 def get_processor_service(
     file_repository=Depends(get_minio_repository),
     websocket_manager=Depends(get_websocket_manager),
+    executable_cache=Depends(get_executable_cache),
+    process_registry=Depends(get_process_registry),
 ) -> ProcessorService:
     return ProcessorService(
         file_repository,
         websocket_manager,
+        executable_cache,
+        process_registry,
     )
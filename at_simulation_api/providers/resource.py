@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from at_simulation_api.providers.model_cache import get_model_cache
 from at_simulation_api.providers.visio import get_visio_service
 from at_simulation_api.repository.editor.resource.repository import ResourceRepository
 from at_simulation_api.service.editor.resource.service import ResourceService
@@ -14,5 +15,6 @@ def get_resource_repository(session: Session = Depends(get_db)) -> ResourceRepos
 def get_resource_service(
     resource_rep=Depends(get_resource_repository),
     visio_service=Depends(get_visio_service),
+    model_cache=Depends(get_model_cache),
 ) -> ResourceService:
-    return ResourceService(resource_rep, visio_service)
+    return ResourceService(resource_rep, visio_service, model_cache)
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from at_simulation_api.providers.model_cache import get_model_cache
 from at_simulation_api.providers.visio import get_visio_service
 from at_simulation_api.repository.editor.template.repository import TemplateRepository
 from at_simulation_api.service.editor.template.service import TemplateService
@@ -14,5 +15,6 @@ def get_template_repository(session: Session = Depends(get_db)) -> TemplateRepos
 def get_template_service(
     template_rep=Depends(get_template_repository),
     visio_service=Depends(get_visio_service),
+    model_cache=Depends(get_model_cache),
 ) -> TemplateService:
-    return TemplateService(template_rep, visio_service)
+    return TemplateService(template_rep, visio_service, model_cache)
@@ -1,17 +1,55 @@
+from functools import lru_cache
+from typing import Union
+
 from fastapi import Depends
 
+from at_simulation_api.config.translator import TranslatorStore
 from at_simulation_api.providers.minio import get_minio_repository
-from at_simulation_api.providers.model import get_model_service
+from at_simulation_api.providers.model import get_async_model_service
+from at_simulation_api.repository.local_cache.repository import LocalFileCache
 from at_simulation_api.repository.minio.repository import MinioRepository
-from at_simulation_api.service.model.service import ModelService
+from at_simulation_api.service.file_index.service import TranslatedFileIndex
+from at_simulation_api.service.model.async_service import (
+    AsyncModelService,
+    ThreadedModelService,
+)
+from at_simulation_api.service.translator.jobs import TranslationJobManager
 from at_simulation_api.service.translator.service import TranslatorService
+from at_simulation_api.storage.minio.storage import get_minio_storage
+from at_simulation_api.storage.postgres.storage import session_scope
+
+
+@lru_cache(maxsize=1)
+def get_compile_cache() -> LocalFileCache:
+    config = TranslatorStore.get_translator_config()
+    return LocalFileCache(config.compile_cache_dir, config.compile_cache_max_size)
+
+
+@lru_cache(maxsize=1)
+def get_translation_job_manager() -> TranslationJobManager:
+    config = TranslatorStore.get_translator_config()
+    return TranslationJobManager(config.max_concurrent_builds, config.job_ttl)
+
+
+@lru_cache(maxsize=1)
+def get_translated_file_index() -> TranslatedFileIndex:
+    client, bucket_name = get_minio_storage()
+    return TranslatedFileIndex(session_scope, MinioRepository(client, bucket_name))
 
 
 def get_translator_service(
-    model_service: ModelService = Depends(get_model_service),
+    model_service: Union[AsyncModelService, ThreadedModelService] = Depends(
+        get_async_model_service
+    ),
     file_repository: MinioRepository = Depends(get_minio_repository),
+    compile_cache: LocalFileCache = Depends(get_compile_cache),
+    job_manager: TranslationJobManager = Depends(get_translation_job_manager),
+    file_index: TranslatedFileIndex = Depends(get_translated_file_index),
 ) -> TranslatorService:
     return TranslatorService(
         model_service,
         file_repository,
+        compile_cache,
+        job_manager,
+        file_index,
     )
@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+from at_simulation_api.config.worker import WorkerStore
+from at_simulation_api.worker.executor import WorkerExecutor
+
+
+@lru_cache(maxsize=1)
+def get_worker_executor() -> WorkerExecutor:
+    config = WorkerStore.get_worker_config()
+    return WorkerExecutor(config.thread_pool_size, config.max_concurrent_calls)
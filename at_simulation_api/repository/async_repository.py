@@ -0,0 +1,32 @@
+from typing import Any, Callable, Coroutine, Generic, Type, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+R = TypeVar("R")
+
+
+class AsyncRepository(Generic[R]):
+    """
+    Async variant of a sync repository. Every public method of
+    ``repository_class`` becomes a coroutine that runs the sync implementation
+    through ``AsyncSession.run_sync``, so queries go through the async driver
+    without occupying a thread.
+    """
+
+    repository_class: Type[R]
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.repository_class, name)
+
+        async def call(*args, **kwargs):
+            return await self.db_session.run_sync(
+                lambda session: method(self.repository_class(session), *args, **kwargs)
+            )
+
+        call.__name__ = name
+        return call
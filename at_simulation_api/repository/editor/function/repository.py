@@ -1,14 +1,18 @@
 from typing import List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from at_simulation_api.repository.async_repository import AsyncRepository
 from at_simulation_api.repository.editor.function.models.conversions import (
     to_Function,
     to_FunctionDB,
     to_FunctionParameter,
 )
 from at_simulation_api.repository.editor.function.models.models import FunctionDB
-from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.helper import (
+    bump_model_revision,
+    handle_sqlalchemy_errors,
+)
 from at_simulation_api.schema.function import Function, FunctionParameter
 
 
@@ -28,6 +32,7 @@ class FunctionRepository:
         ]
 
         self.db_session.add_all(new_function_parameters)
+        bump_model_revision(self.db_session, function.model_id)
 
         return new_function.id
 
@@ -42,12 +47,14 @@ class FunctionRepository:
     @handle_sqlalchemy_errors
     def get_functions(self, model_id: int) -> List[FunctionDB]:
         functions = (
-            self.db_session.query(Function).filter(Function.model_id == model_id).all()
+            self.db_session.query(Function)
+            .filter(Function.model_id == model_id)
+            .options(selectinload(Function.parameters))
+            .all()
         )
 
         functions_db = [
-            to_FunctionDB(function, self._get_parameters_by_function_id(function.id))
-            for function in functions
+            to_FunctionDB(function, function.parameters) for function in functions
         ]
         return functions_db
 
@@ -82,6 +89,7 @@ class FunctionRepository:
             param_to_delete = existing_parameters[param_id]
             self.db_session.delete(param_to_delete)
 
+        bump_model_revision(self.db_session, function.model_id)
         return function.id
 
     @handle_sqlalchemy_errors
@@ -90,6 +98,7 @@ class FunctionRepository:
         if not function:
             raise RuntimeError("Function not found")
         self.db_session.delete(function)
+        bump_model_revision(self.db_session, function.model_id)
 
         return function_id
 
@@ -109,3 +118,7 @@ class FunctionRepository:
             .filter(FunctionParameter.function_id == function_id)
             .all()
         )
+
+
+class AsyncFunctionRepository(AsyncRepository[FunctionRepository]):
+    repository_class = FunctionRepository
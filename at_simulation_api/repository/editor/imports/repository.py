@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from at_simulation_api.repository.editor.imports.models.conversions import (
     to_Import,
@@ -8,7 +8,10 @@ from at_simulation_api.repository.editor.imports.models.conversions import (
     to_Package,
 )
 from at_simulation_api.repository.editor.imports.models.models import ImportDB
-from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.helper import (
+    bump_model_revision,
+    handle_sqlalchemy_errors,
+)
 from at_simulation_api.schema.imports import Import, Package
 
 
@@ -26,6 +29,7 @@ class ImportRepository:
         new_import_pkgs = [to_Package(pkg, new_import.id) for pkg in imp.packages]
 
         self.db_session.add_all(new_import_pkgs)
+        bump_model_revision(self.db_session, imp.model_id)
 
         return new_import.id
 
@@ -40,12 +44,13 @@ class ImportRepository:
     @handle_sqlalchemy_errors
     def get_imports(self, model_id: int) -> List[ImportDB]:
         imports = (
-            self.db_session.query(Import).filter(Import.model_id == model_id).all()
+            self.db_session.query(Import)
+            .filter(Import.model_id == model_id)
+            .options(selectinload(Import.packages))
+            .all()
         )
 
-        imports_db = [
-            to_ImportDB(imp, self._get_pkgs_by_import_id(imp.id)) for imp in imports
-        ]
+        imports_db = [to_ImportDB(imp, imp.packages) for imp in imports]
         return imports_db
 
     @handle_sqlalchemy_errors
@@ -78,6 +83,7 @@ class ImportRepository:
             pkg_to_delete = existing_pkgs[pkg_id]
             self.db_session.delete(pkg_to_delete)
 
+        bump_model_revision(self.db_session, imp.model_id)
         return imp.id
 
     @handle_sqlalchemy_errors
@@ -86,6 +92,7 @@ class ImportRepository:
         if not imp:
             raise RuntimeError("Import not found")
         self.db_session.delete(imp)
+        bump_model_revision(self.db_session, imp.model_id)
 
         return import_id
 
@@ -1,7 +1,8 @@
 from typing import List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from at_simulation_api.repository.async_repository import AsyncRepository
 from at_simulation_api.repository.editor.resource.models.conversions import (
     to_Resource,
     to_ResourceAttribute,
@@ -14,7 +15,10 @@ from at_simulation_api.repository.editor.resource.models.models import (
     ResourceDB,
     ResourceTypeDB,
 )
-from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.helper import (
+    bump_model_revision,
+    handle_sqlalchemy_errors,
+)
 from at_simulation_api.schema.resource import (
     Resource,
     ResourceAttribute,
@@ -38,6 +42,7 @@ class ResourceRepository:
             for attr in resource_type.attributes
         ]
         self.db_session.add_all(new_resource_types_attributes)
+        bump_model_revision(self.db_session, resource_type.model_id)
         return new_resource_type.id
 
     @handle_sqlalchemy_errors
@@ -53,14 +58,12 @@ class ResourceRepository:
         resource_types = (
             self.db_session.query(ResourceType)
             .filter(ResourceType.model_id == model_id)
+            .options(selectinload(ResourceType.attributes))
             .all()
         )
 
         resource_types_db = [
-            to_ResourceTypeDB(
-                resource_type,
-                self._get_attributes_by_resource_type_id(resource_type.id),
-            )
+            to_ResourceTypeDB(resource_type, resource_type.attributes)
             for resource_type in resource_types
         ]
         return resource_types_db
@@ -96,6 +99,7 @@ class ResourceRepository:
             attr_to_delete = existing_attributes[attr_id]
             self.db_session.delete(attr_to_delete)
 
+        bump_model_revision(self.db_session, resource_type.model_id)
         return resource_type.id
 
     @handle_sqlalchemy_errors
@@ -104,6 +108,7 @@ class ResourceRepository:
         if not resource_type:
             raise RuntimeError("Resource type not found")
         self.db_session.delete(resource_type)
+        bump_model_revision(self.db_session, resource_type.model_id)
 
         return resource_type_id
 
@@ -117,6 +122,7 @@ class ResourceRepository:
             to_ResourceAttribute(attr, new_resource.id) for attr in resource.attributes
         ]
         self.db_session.add_all(new_resource_attributes)
+        bump_model_revision(self.db_session, resource.model_id)
 
         return new_resource.id
 
@@ -132,12 +138,14 @@ class ResourceRepository:
     @handle_sqlalchemy_errors
     def get_resources(self, model_id: int) -> List[ResourceDB]:
         resources = (
-            self.db_session.query(Resource).filter(Resource.model_id == model_id).all()
+            self.db_session.query(Resource)
+            .filter(Resource.model_id == model_id)
+            .options(selectinload(Resource.attributes))
+            .all()
         )
 
         resources_db = [
-            to_ResourceDB(resource, self._get_attributes_by_resource_id(resource.id))
-            for resource in resources
+            to_ResourceDB(resource, resource.attributes) for resource in resources
         ]
         return resources_db
 
@@ -165,6 +173,7 @@ class ResourceRepository:
             else:
                 raise RuntimeError("Resource attribute not found")
 
+        bump_model_revision(self.db_session, resource.model_id)
         return resource.id
 
     @handle_sqlalchemy_errors
@@ -173,6 +182,7 @@ class ResourceRepository:
         if not resource:
             raise RuntimeError("Resource not found")
         self.db_session.delete(resource)
+        bump_model_revision(self.db_session, resource.model_id)
 
         return resource_id
 
@@ -211,3 +221,7 @@ class ResourceRepository:
             .filter(ResourceTypeAttribute.resource_type_id == resource_type_id)
             .all()
         )
+
+
+class AsyncResourceRepository(AsyncRepository[ResourceRepository]):
+    repository_class = ResourceRepository
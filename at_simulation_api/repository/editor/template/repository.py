@@ -1,7 +1,8 @@
 from typing import Any, Callable, List, Optional, Tuple, TypeVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from at_simulation_api.repository.async_repository import AsyncRepository
 from at_simulation_api.repository.editor.template.models.conversions import (
     to_IrregularEventBody,
     to_IrregularEventDB,
@@ -25,7 +26,10 @@ from at_simulation_api.repository.editor.template.models.models import (
     TemplateMetaDB,
     TemplateUsageDB,
 )
-from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.helper import (
+    bump_model_revision,
+    handle_sqlalchemy_errors,
+)
 from at_simulation_api.schema.template import (
     IrregularEventBody,
     IrregularEventGenerator,
@@ -94,16 +98,22 @@ class TemplateRepository:
     @handle_sqlalchemy_errors
     def get_irregular_events(self, model_id: int) -> List[IrregularEventDB]:
         return self._get_templates(
-            model_id, self.get_irregular_event, "IRREGULAR_EVENT"
+            model_id,
+            "IRREGULAR_EVENT",
+            to_IrregularEventDB,
+            Template.irregular_event_bodies,
+            Template.irregular_event_generators,
         )
 
     @handle_sqlalchemy_errors
     def get_operations(self, model_id: int) -> List[OperationDB]:
-        return self._get_templates(model_id, self.get_operation, "OPERATION")
+        return self._get_templates(
+            model_id, "OPERATION", to_OperationDB, Template.operation_bodies
+        )
 
     @handle_sqlalchemy_errors
     def get_rules(self, model_id: int) -> List[RuleDB]:
-        return self._get_templates(model_id, self.get_rule, "RULE")
+        return self._get_templates(model_id, "RULE", to_RuleDB, Template.rule_bodies)
 
     @handle_sqlalchemy_errors
     def get_template_meta(self, template_id: int) -> TemplateMetaDB:
@@ -119,6 +129,7 @@ class TemplateRepository:
             raise RuntimeError("Template does not exist")
 
         self.db_session.delete(template_meta)
+        bump_model_revision(self.db_session, template_meta.model_id)
         return template_id
 
     @handle_sqlalchemy_errors
@@ -127,6 +138,7 @@ class TemplateRepository:
         self.db_session.add(new_template_usage)
         self.db_session.flush()
         self._process_arguments(template_usage, new_template_usage.id)
+        bump_model_revision(self.db_session, template_usage.model_id)
         return new_template_usage.id
 
     @handle_sqlalchemy_errors
@@ -140,17 +152,14 @@ class TemplateRepository:
         template_usages = (
             self.db_session.query(TemplateUsage)
             .filter(TemplateUsage.model_id == model_id)
+            .options(selectinload(TemplateUsage.template_usage_args))
             .all()
         )
 
-        template_usages_db = []
-        for usage in template_usages:
-            arguments = (
-                self.db_session.query(TemplateUsageArgument)
-                .filter(TemplateUsageArgument.template_usage_id == usage.id)
-                .all()
-            )
-            template_usages_db.append(to_TemplateUsageDB(usage, arguments))
+        template_usages_db = [
+            to_TemplateUsageDB(usage, usage.template_usage_args)
+            for usage in template_usages
+        ]
 
         return template_usages_db
 
@@ -159,12 +168,14 @@ class TemplateRepository:
         existing_template_usage = self._get_template_usage_by_id(template_usage.id)
         existing_template_usage.name = template_usage.name
         self._process_arguments(template_usage, existing_template_usage.id)
+        bump_model_revision(self.db_session, existing_template_usage.model_id)
         return template_usage.id
 
     @handle_sqlalchemy_errors
     def delete_template_usage(self, template_usage_id: int) -> int:
         template_usage = self._get_template_usage_by_id(template_usage_id)
         self.db_session.delete(template_usage)
+        bump_model_revision(self.db_session, template_usage.model_id)
         return template_usage_id
 
     def _get_template_usage_by_id(self, template_usage_id: int) -> TemplateUsage:
@@ -201,13 +212,33 @@ class TemplateRepository:
                 self.db_session.add(new_arg)
 
     def _get_templates(
-        self, model_id: int, get_func: Callable[[int], T], template_type: str
+        self,
+        model_id: int,
+        template_type: str,
+        conversion_func: Callable,
+        body_relation: Any,
+        generator_relation: Any = None,
     ) -> List[T]:
-        template_ids = self._get_template_ids(model_id, template_type)
+        relations = [Template.relevant_resources, body_relation]
+        if generator_relation is not None:
+            relations.append(generator_relation)
+
+        templates = (
+            self.db_session.query(Template)
+            .filter(Template.model_id == model_id, Template.type == template_type)
+            .options(*[selectinload(relation) for relation in relations])
+            .all()
+        )
 
         results = []
-        for template_id in template_ids:
-            results.append(get_func(template_id))
+        for template in templates:
+            parts = [
+                self._get_loaded_template_part(template, relation)
+                for relation in relations[1:]
+            ]
+            results.append(
+                conversion_func(template, template.relevant_resources, *parts)
+            )
 
         return results
 
@@ -285,16 +316,6 @@ class TemplateRepository:
             .delete(synchronize_session=False)
         )
 
-    def _get_template_ids(self, model_id: int, template_type: str) -> List[int]:
-        return [
-            template_id
-            for template_id, in (
-                self.db_session.query(Template.id)
-                .filter(Template.model_id == model_id, Template.type == template_type)
-                .all()
-            )
-        ]
-
     def _get_template_part(self, template_id: int, part_table: Any) -> Any:
         part = (
             self.db_session.query(part_table)
@@ -305,6 +326,13 @@ class TemplateRepository:
             raise RuntimeError(f"{part_table.__name__} does not exist")
         return part
 
+    def _get_loaded_template_part(self, template: Template, relation: Any) -> Any:
+        parts = getattr(template, relation.key)
+        if not parts:
+            part_table = relation.property.mapper.class_
+            raise RuntimeError(f"{part_table.__name__} does not exist")
+        return parts[0]
+
     def _update_template(
         self,
         template: T,
@@ -319,6 +347,7 @@ class TemplateRepository:
 
         new_body = body_func(template.body, template_meta.id)
         self.db_session.add(new_body)
+        bump_model_revision(self.db_session, template_meta.model_id)
 
         return template_meta.id
 
@@ -336,6 +365,7 @@ class TemplateRepository:
 
         new_body = body_func(template.body, new_template.id)
         self.db_session.add(new_body)
+        bump_model_revision(self.db_session, new_template.model_id)
 
         return new_template.id
 
@@ -355,3 +385,7 @@ class TemplateRepository:
             return conversion_func(template_meta, rel_resources, body, generator)
 
         return conversion_func(template_meta, rel_resources, body)
+
+
+class AsyncTemplateRepository(AsyncRepository[TemplateRepository]):
+    repository_class = TemplateRepository
@@ -1,6 +1,10 @@
 from functools import wraps
 
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from at_simulation_api.schema.model import Model
 
 
 def handle_sqlalchemy_errors(func):
@@ -13,3 +17,9 @@ def handle_sqlalchemy_errors(func):
             raise RuntimeError(f"Failed to execute {method_name}: {e}") from e
 
     return wrapper
+
+
+def bump_model_revision(db_session: Session, model_id: int) -> None:
+    db_session.execute(
+        update(Model).where(Model.id == model_id).values(revision=Model.revision + 1)
+    )
@@ -0,0 +1,146 @@
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+
+logger = logging.getLogger(__name__)
+
+_TMP_SUFFIX = ".tmp"
+
+
+class LocalFileCache:
+    """
+    Directory of files addressed by key with LRU eviction once the total
+    size exceeds ``max_size``. Recency survives restarts through file mtimes.
+    Entries handed out by ``acquire`` are pinned and never evicted until
+    every holder calls ``release``.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int):
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._pins: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._get(key, pin=False)
+
+    def acquire(self, key: str) -> Optional[str]:
+        return self._get(key, pin=True)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            pins = self._pins.get(key, 0) - 1
+            if pins > 0:
+                self._pins[key] = pins
+                return
+            self._pins.pop(key, None)
+            self._evict()
+
+    def _get(self, key: str, pin: bool) -> Optional[str]:
+        with self._lock:
+            self._ensure_loaded()
+            if key not in self._entries:
+                self._misses += 1
+                return None
+
+            path = self._get_path(key)
+            if not os.path.exists(path):
+                self._size -= self._entries.pop(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if pin:
+                self._pins[key] = self._pins.get(key, 0) + 1
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, key: str, file_path: str, pin: bool = False) -> str:
+        with self._lock:
+            self._ensure_loaded()
+
+        path = self._get_path(key)
+        tmp_path = f"{path}.{uuid.uuid4().hex}{_TMP_SUFFIX}"
+        shutil.copy2(file_path, tmp_path)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)
+            self._entries[key] = size
+            self._size += size
+            if pin:
+                self._pins[key] = self._pins.get(key, 0) + 1
+            self._evict()
+
+        return path
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            self._ensure_loaded()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size=self._size,
+                max_size=self._max_size,
+            )
+
+    def _evict(self) -> None:
+        # the newest entry is kept even when pinned ones hold the space
+        for key in list(self._entries)[:-1]:
+            if self._size <= self._max_size:
+                return
+            if key in self._pins:
+                continue
+            self._size -= self._entries.pop(key)
+            try:
+                os.remove(self._get_path(key))
+            except OSError as e:
+                logger.warning(f"Failed to evict cached file {key}: {e}")
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._load_entries()
+        self._loaded = True
+
+    def _load_entries(self) -> None:
+        files = []
+        for entry in os.scandir(self._cache_dir):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(_TMP_SUFFIX):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key)
@@ -1,7 +1,7 @@
 import os
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Set
 
 from minio import Minio, S3Error
 
@@ -15,9 +15,11 @@ class MinioRepository:
 
     def load_file(
         self, user_id: int, file_path: str, file_name: str, model_id: int
-    ) -> str:
+    ) -> MinioFile:
         timestamp = datetime.now()
-        minio_file_name = f"{uuid.uuid4()}"
+        # prefixed so objects can be listed per user and model; flat keys of
+        # older uploads stay valid ids since lookups use the key as is
+        minio_file_name = f"user/{user_id}/model/{model_id}/{uuid.uuid4()}"
 
         meta_data = FileMeta(
             user_id=user_id,
@@ -33,7 +35,12 @@ class MinioRepository:
             metadata=meta_data.to_dict(),
         )
 
-        return minio_file_name
+        return MinioFile(
+            minio_name=minio_file_name,
+            last_modified=timestamp.astimezone(),
+            size=os.path.getsize(file_path),
+            file_meta=meta_data,
+        )
 
     def fetch_file(self, file_uuid: str, file_path: str) -> str:
         try:
@@ -42,7 +49,9 @@ class MinioRepository:
             unique_suffix = (
                 f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex}"
             )
-            local_file_path = f"{file_path}/{file_uuid}_{unique_suffix}"
+            local_file_path = (
+                f"{file_path}/{os.path.basename(file_uuid)}_{unique_suffix}"
+            )
 
             response = self._minio_client.get_object(self._bucket_name, file_uuid)
             with open(local_file_path, "wb") as f:
@@ -55,39 +64,16 @@ class MinioRepository:
         except Exception as e:
             raise Exception(f"Error fetching file from MinIO: {e}")
 
-    def get_files(self, user_id: int) -> List[MinioFile]:
-        user_files: List[MinioFile] = []
-
+    def get_file_names(self) -> Set[str]:
         try:
-            objects = self._minio_client.list_objects(self._bucket_name, recursive=True)
-            for obj in objects:
-                obj_metadata = self._minio_client.stat_object(
-                    self._bucket_name,
-                    obj.object_name,
+            return {
+                obj.object_name
+                for obj in self._minio_client.list_objects(
+                    self._bucket_name, recursive=True
                 )
-
-                if obj_metadata.metadata.get("x-amz-meta-user_id") == str(user_id):
-                    file_meta = FileMeta(
-                        user_id=int(obj_metadata.metadata.get("x-amz-meta-user_id")),
-                        file_name=obj_metadata.metadata.get("x-amz-meta-file_name"),
-                        model_id=obj_metadata.metadata.get("x-amz-meta-model_id"),
-                        created_at=datetime.fromisoformat(
-                            obj_metadata.metadata.get("x-amz-meta-created_at")
-                        ),
-                    )
-
-                    user_files.append(
-                        MinioFile(
-                            minio_name=obj.object_name,
-                            last_modified=obj.last_modified,
-                            size=obj.size,
-                            file_meta=file_meta,
-                        )
-                    )
+            }
         except S3Error as e:
-            raise S3Error(f"Error retrieving files: {e}")
-
-        return user_files
+            raise Exception(f"Error listing files: {e}")
 
     def get_file(self, file_uuid: str) -> MinioFile:
         try:
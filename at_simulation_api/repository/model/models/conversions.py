@@ -8,6 +8,7 @@ def to_ModelMetaDB(model: Model) -> ModelMetaDB:
         name=model.name,
         user_id=model.user_id,
         created_at=model.created_at,
+        revision=model.revision,
     )
 
 
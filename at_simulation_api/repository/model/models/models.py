@@ -9,3 +9,4 @@ class ModelMetaDB(BaseModel):
     name: str
     user_id: int
     created_at: Optional[datetime] = None
+    revision: int = 0
@@ -2,7 +2,11 @@ from typing import List
 
 from sqlalchemy.orm import Session
 
-from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.async_repository import AsyncRepository
+from at_simulation_api.repository.helper import (
+    bump_model_revision,
+    handle_sqlalchemy_errors,
+)
 from at_simulation_api.repository.model.models.conversions import (
     to_Model,
     to_ModelMetaDB,
@@ -32,10 +36,16 @@ class ModelRepository:
         models = self.db_session.query(Model).filter_by(user_id=user_id).all()
         return [to_ModelMetaDB(model) for model in models]
 
+    @handle_sqlalchemy_errors
+    def get_model_metas(self, model_ids: List[int]) -> List[ModelMetaDB]:
+        models = self.db_session.query(Model).filter(Model.id.in_(model_ids)).all()
+        return [to_ModelMetaDB(model) for model in models]
+
     @handle_sqlalchemy_errors
     def update_model(self, model: ModelMetaDB) -> int:
         existing_model = self._get_model_by_id(model.id)
         existing_model.name = model.name
+        bump_model_revision(self.db_session, existing_model.id)
         return existing_model.id
 
     @handle_sqlalchemy_errors
@@ -49,3 +59,7 @@ class ModelRepository:
         if not model:
             raise ValueError("Model does not exist")
         return model
+
+
+class AsyncModelRepository(AsyncRepository[ModelRepository]):
+    repository_class = ModelRepository
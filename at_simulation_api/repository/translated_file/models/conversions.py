@@ -0,0 +1,28 @@
+from at_simulation_api.repository.minio.models.models import FileMeta, MinioFile
+from at_simulation_api.schema.translated_file import TranslatedFile
+
+
+def to_TranslatedFile(file: MinioFile) -> TranslatedFile:
+    return TranslatedFile(
+        id=file.minio_name,
+        user_id=file.file_meta.user_id,
+        model_id=file.file_meta.model_id,
+        file_name=file.file_meta.file_name,
+        size=file.size,
+        created_at=file.file_meta.created_at,
+        last_modified=file.last_modified,
+    )
+
+
+def to_MinioFile(file: TranslatedFile) -> MinioFile:
+    return MinioFile(
+        minio_name=file.id,
+        last_modified=file.last_modified,
+        size=file.size,
+        file_meta=FileMeta(
+            user_id=file.user_id,
+            file_name=file.file_name,
+            model_id=file.model_id,
+            created_at=file.created_at,
+        ),
+    )
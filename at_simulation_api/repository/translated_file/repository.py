@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from at_simulation_api.repository.helper import handle_sqlalchemy_errors
+from at_simulation_api.repository.minio.models.models import MinioFile
+from at_simulation_api.repository.translated_file.models.conversions import (
+    to_MinioFile,
+    to_TranslatedFile,
+)
+from at_simulation_api.schema.translated_file import TranslatedFile
+
+
+class TranslatedFileRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    @handle_sqlalchemy_errors
+    def add_file(self, file: MinioFile) -> str:
+        self.db_session.merge(to_TranslatedFile(file))
+        return file.minio_name
+
+    @handle_sqlalchemy_errors
+    def get_files(
+        self,
+        user_id: int,
+        limit: int,
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> List[MinioFile]:
+        query = self.db_session.query(TranslatedFile).filter(
+            TranslatedFile.user_id == user_id
+        )
+        if before:
+            query = query.filter(
+                tuple_(TranslatedFile.created_at, TranslatedFile.id) < tuple_(*before)
+            )
+
+        files = (
+            query.order_by(TranslatedFile.created_at.desc(), TranslatedFile.id.desc())
+            .limit(limit)
+            .all()
+        )
+        return [to_MinioFile(file) for file in files]
+
+    @handle_sqlalchemy_errors
+    def count_files(self, user_id: int) -> int:
+        return (
+            self.db_session.query(TranslatedFile)
+            .filter(TranslatedFile.user_id == user_id)
+            .count()
+        )
+
+    @handle_sqlalchemy_errors
+    def get_file_ids(self) -> Set[str]:
+        return {row[0] for row in self.db_session.query(TranslatedFile.id).all()}
+
+    @handle_sqlalchemy_errors
+    def delete_files(self, file_ids: Set[str]) -> int:
+        if not file_ids:
+            return 0
+        return (
+            self.db_session.query(TranslatedFile)
+            .filter(TranslatedFile.id.in_(file_ids))
+            .delete(synchronize_session=False)
+        )
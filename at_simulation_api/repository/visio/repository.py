@@ -112,8 +112,8 @@ class VisioRepository:
         node = (
             self.db_session.query(Node)
             .filter(
-                Node.object_table == object_table.value.__tablename__
-                and Node.object_id == object_id
+                Node.object_table == object_table.value.__tablename__,
+                Node.object_id == object_id,
             )
             .first()
         )
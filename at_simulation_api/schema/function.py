@@ -1,4 +1,12 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from at_simulation_api.schema.base import Base
@@ -21,6 +29,7 @@ class Function(Base):
             "model_id",
             name="uix_function_name_model_id",
         ),
+        Index("ix_functions_model_id", "model_id"),
     )
 
 
@@ -39,4 +48,5 @@ class FunctionParameter(Base):
             "function_id",
             name="uix_function_parameter_function",
         ),
+        Index("ix_function_parameters_function_id", "function_id"),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -19,6 +19,7 @@ class Import(Base):
             "model_id",
             name="uix_import_name_model_id",
         ),
+        Index("ix_imports_model_id", "model_id"),
     )
 
 
@@ -42,4 +43,5 @@ class Package(Base):
             "import_id",
             name="uix_package_alias_import_id",
         ),
+        Index("ix_packages_import_id", "import_id"),
     )
@@ -13,6 +13,7 @@ class Model(Base):
     name = Column(String, nullable=False)
     user_id = Column(Integer, nullable=False)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.now())
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
 
     nodes = relationship("Node", cascade="all, delete-orphan")
     edges = relationship("Edge", cascade="all, delete-orphan")
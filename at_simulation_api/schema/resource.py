@@ -6,6 +6,7 @@ from sqlalchemy import (
     Column,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -39,6 +40,7 @@ class ResourceType(Base):
             "model_id",
             name="uix_resource_type_name_model_id",
         ),
+        Index("ix_resource_types_model_id", "model_id"),
     )
 
 
@@ -62,6 +64,7 @@ class ResourceTypeAttribute(Base):
             "resource_type_id",
             name="uix_resource_type_attribute_name_resource_type_id",
         ),
+        Index("ix_resource_type_attributes_resource_type_id", "resource_type_id"),
     )
 
 
@@ -85,6 +88,8 @@ class Resource(Base):
             "model_id",
             name="uix_resource_name_model_id",
         ),
+        Index("ix_resources_model_id", "model_id"),
+        Index("ix_resources_resource_type_id", "resource_type_id"),
     )
 
 
@@ -96,3 +101,8 @@ class ResourceAttribute(Base):
 
     resource_id = Column(Integer, ForeignKey("resources.id"), nullable=False)
     rta_id = Column(Integer, ForeignKey("resource_type_attributes.id"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_resource_attributes_resource_id", "resource_id"),
+        Index("ix_resource_attributes_rta_id", "rta_id"),
+    )
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -44,6 +45,7 @@ class Template(Base):
             "model_id",
             name="uix_template_name_model_id",
         ),
+        Index("ix_templates_model_id_type", "model_id", "type"),
     )
 
 
@@ -63,6 +65,8 @@ class RelevantResource(Base):
             "template_id",
             name="uix_relevant_resource_name_template_id",
         ),
+        Index("ix_relevant_resources_template_id", "template_id"),
+        Index("ix_relevant_resources_resource_type_id", "resource_type_id"),
     )
 
 
@@ -81,6 +85,8 @@ class TemplateUsage(Base):
             "name",
             "model_id",
         ),
+        Index("ix_template_usages_model_id", "model_id"),
+        Index("ix_template_usages_template_id", "template_id"),
     )
 
 
@@ -97,6 +103,12 @@ class TemplateUsageArgument(Base):
     )
     resource_id = Column(Integer, ForeignKey("resources.id"), nullable=False)
 
+    __table_args__ = (
+        Index("ix_template_usage_args_template_usage_id", "template_usage_id"),
+        Index("ix_template_usage_args_relevant_resource_id", "relevant_resource_id"),
+        Index("ix_template_usage_args_resource_id", "resource_id"),
+    )
+
 
 class IrregularEventBody(Base):
     __tablename__ = "irregular_event_bodies"
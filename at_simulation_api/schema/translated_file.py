@@ -0,0 +1,20 @@
+from sqlalchemy import TIMESTAMP, BigInteger, Column, Index, Integer, String
+
+from .base import Base
+
+
+class TranslatedFile(Base):
+    __tablename__ = "translated_files"
+
+    id = Column(String, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    model_id = Column(Integer, nullable=False)
+    file_name = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False)
+    last_modified = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_translated_files_user_id_created_at", "user_id", "created_at"),
+        Index("ix_translated_files_model_id", "model_id"),
+    )
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Column,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -58,6 +59,11 @@ class Node(Base):
         "Edge", cascade="all, delete-orphan", foreign_keys="[Edge.to_node]"
     )
 
+    __table_args__ = (
+        Index("ix_nodes_model_id", "model_id"),
+        Index("ix_nodes_object_table_object_id", "object_table", "object_id"),
+    )
+
 
 def delete_associated_node(mapper, connection: Connection, target):
     node_ids = connection.execute(
@@ -107,4 +113,7 @@ class Edge(Base):
             "from_node != to_node",
             name="check_from_node_to_node_diff",
         ),
+        Index("ix_edges_model_id", "model_id"),
+        Index("ix_edges_from_node", "from_node"),
+        Index("ix_edges_to_node", "to_node"),
     )
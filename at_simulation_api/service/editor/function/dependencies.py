@@ -3,6 +3,7 @@ from typing import List, Protocol
 from at_simulation_api.repository.editor.function.models.models import FunctionDB
 from at_simulation_api.repository.editor.function.repository import FunctionRepository
 from at_simulation_api.repository.visio.models.models import NodeTypesEnum
+from at_simulation_api.service.model.cache import ModelCache
 from at_simulation_api.service.visio.service import VisioService
 
 
@@ -32,3 +33,10 @@ class IVisioService(Protocol):
 
 
 _: IVisioService = VisioService(...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IModelCache(Protocol):
+    def evict(self, model_id: int) -> None: ...
+
+
+_: IModelCache = ModelCache(...)  # type: ignore[arg-type, reportArgumentType]
@@ -5,6 +5,7 @@ from at_simulation_api.repository.editor.function.models.models import FunctionD
 from at_simulation_api.repository.visio.models.models import NodeTypesEnum
 from at_simulation_api.service.editor.function.dependencies import (
     IFunctionRepository,
+    IModelCache,
     IVisioService,
 )
 from at_simulation_api.service.helpers import handle_rollback
@@ -15,9 +16,11 @@ class FunctionService(metaclass=WrapMethodsMeta):
         self,
         function_rep: IFunctionRepository,
         visio_service: IVisioService,
+        model_cache: IModelCache,
     ) -> None:
         self._function_rep = function_rep
         self._visio_service = visio_service
+        self._model_cache = model_cache
 
     def _check_function_rights(self, function_id: int, model_id: int) -> None:
         function = self._function_rep.get_function(function_id)
@@ -37,6 +40,7 @@ class FunctionService(metaclass=WrapMethodsMeta):
                 function.model_id,
             )
 
+        self._model_cache.evict(function.model_id)
         return obj_id
 
     def get_function(self, function_id: int, model_id: int) -> FunctionDB:
@@ -58,8 +62,11 @@ class FunctionService(metaclass=WrapMethodsMeta):
                 NodeTypesEnum.FUNCTION,
             )
 
+        self._model_cache.evict(function.model_id)
         return obj_id
 
     def delete_function(self, function_id: int, model_id: int) -> int:
         self._check_function_rights(function_id, model_id)
-        return self._function_rep.delete_function(function_id)
+        obj_id = self._function_rep.delete_function(function_id)
+        self._model_cache.evict(model_id)
+        return obj_id
@@ -2,6 +2,7 @@ from typing import List, Protocol
 
 from at_simulation_api.repository.editor.imports.models.models import ImportDB
 from at_simulation_api.repository.editor.imports.repository import ImportRepository
+from at_simulation_api.service.model.cache import ModelCache
 
 
 class IImportRepository(Protocol):
@@ -17,3 +18,10 @@ class IImportRepository(Protocol):
 
 
 _: IImportRepository = ImportRepository(...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IModelCache(Protocol):
+    def evict(self, model_id: int) -> None: ...
+
+
+_: IModelCache = ModelCache(...)  # type: ignore[arg-type, reportArgumentType]
@@ -2,15 +2,20 @@ from typing import List
 
 from at_simulation_api.core.errors import ForbiddenError, WrapMethodsMeta
 from at_simulation_api.repository.editor.imports.models.models import ImportDB
-from at_simulation_api.service.editor.imports.dependencies import IImportRepository
+from at_simulation_api.service.editor.imports.dependencies import (
+    IImportRepository,
+    IModelCache,
+)
 
 
 class ImportService(metaclass=WrapMethodsMeta):
     def __init__(
         self,
         import_rep: IImportRepository,
+        model_cache: IModelCache,
     ) -> None:
         self._import_rep = import_rep
+        self._model_cache = model_cache
 
     def _check_import_rights(self, import_id: int, model_id: int) -> None:
         imp = self._import_rep.get_import(import_id)
@@ -21,6 +26,7 @@ class ImportService(metaclass=WrapMethodsMeta):
 
     def create_import(self, imp: ImportDB) -> int:
         obj_id = self._import_rep.create_import(imp)
+        self._model_cache.evict(imp.model_id)
         return obj_id
 
     def get_import(self, import_id: int, model_id: int) -> ImportDB:
@@ -33,8 +39,11 @@ class ImportService(metaclass=WrapMethodsMeta):
     def update_import(self, imp: ImportDB) -> int:
         self._check_import_rights(imp.id, imp.model_id)
         obj_id = self._import_rep.update_import(imp)
+        self._model_cache.evict(imp.model_id)
         return obj_id
 
     def delete_import(self, import_id: int, model_id: int) -> int:
         self._check_import_rights(import_id, model_id)
-        return self._import_rep.delete_import(import_id)
+        obj_id = self._import_rep.delete_import(import_id)
+        self._model_cache.evict(model_id)
+        return obj_id
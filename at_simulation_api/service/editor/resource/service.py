@@ -7,6 +7,7 @@ from at_simulation_api.repository.editor.resource.models.models import (
 )
 from at_simulation_api.repository.visio.models.models import NodeTypesEnum
 from at_simulation_api.service.editor.resource.dependencies import (
+    IModelCache,
     IResourceRepository,
     IVisioService,
 )
@@ -18,9 +19,11 @@ class ResourceService(metaclass=WrapMethodsMeta):
         self,
         resource_rep: IResourceRepository,
         visio_service: IVisioService,
+        model_cache: IModelCache,
     ) -> None:
         self._resource_rep = resource_rep
         self._visio_service = visio_service
+        self._model_cache = model_cache
 
     def _check_resource_type_rights(self, resource_type_id: int, model_id: int) -> None:
         resource_type = self._resource_rep.get_resource_type(resource_type_id)
@@ -51,6 +54,7 @@ class ResourceService(metaclass=WrapMethodsMeta):
                 resource_type.model_id,
             )
 
+        self._model_cache.evict(resource_type.model_id)
         return obj_id
 
     def get_resource_type(self, resource_type_id: int, model_id: int) -> ResourceTypeDB:
@@ -72,11 +76,14 @@ class ResourceService(metaclass=WrapMethodsMeta):
                 obj_id, resource_type.name, NodeTypesEnum.RESOURCE_TYPE
             )
 
+        self._model_cache.evict(resource_type.model_id)
         return obj_id
 
     def delete_resource_type(self, resource_type_id: int, model_id: int) -> int:
         self._check_resource_type_rights(resource_type_id, model_id)
-        return self._resource_rep.delete_resource_type(resource_type_id)
+        obj_id = self._resource_rep.delete_resource_type(resource_type_id)
+        self._model_cache.evict(model_id)
+        return obj_id
 
     def create_resource(self, resource: ResourceDB) -> int:
         obj_id = self._resource_rep.create_resource(resource)
@@ -101,6 +108,7 @@ class ResourceService(metaclass=WrapMethodsMeta):
                     resource_type_node.id, resource_node_id, resource.model_id
                 )
 
+        self._model_cache.evict(resource.model_id)
         return obj_id
 
     def get_resource(self, resource_id: int, model_id: int) -> ResourceDB:
@@ -120,8 +128,11 @@ class ResourceService(metaclass=WrapMethodsMeta):
                 obj_id, resource.name, NodeTypesEnum.RESOURCE
             )
 
+        self._model_cache.evict(resource.model_id)
         return obj_id
 
     def delete_resource(self, resource_id: int, model_id: int) -> int:
         self._check_resource_rights(resource_id, model_id)
-        return self._resource_rep.delete_resource(resource_id)
+        obj_id = self._resource_rep.delete_resource(resource_id)
+        self._model_cache.evict(model_id)
+        return obj_id
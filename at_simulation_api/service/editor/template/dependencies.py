@@ -9,6 +9,7 @@ from at_simulation_api.repository.editor.template.models.models import (
 )
 from at_simulation_api.repository.editor.template.repository import TemplateRepository
 from at_simulation_api.repository.visio.models.models import NodeDB, NodeTypesEnum
+from at_simulation_api.service.model.cache import ModelCache
 from at_simulation_api.service.visio.service import VisioService
 
 
@@ -72,3 +73,10 @@ class IVisioService(Protocol):
 
 
 _: IVisioService = VisioService(...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IModelCache(Protocol):
+    def evict(self, model_id: int) -> None: ...
+
+
+_: IModelCache = ModelCache(...)  # type: ignore[arg-type, reportArgumentType]
@@ -10,6 +10,7 @@ from at_simulation_api.repository.editor.template.models.models import (
 )
 from at_simulation_api.repository.visio.models.models import NodeTypesEnum
 from at_simulation_api.service.editor.template.dependencies import (
+    IModelCache,
     ITemplateRepository,
     IVisioService,
 )
@@ -34,9 +35,11 @@ class TemplateService(metaclass=WrapMethodsMeta):
         self,
         template_rep: ITemplateRepository,
         visio_service: IVisioService,
+        model_cache: IModelCache,
     ) -> None:
         self._template_rep = template_rep
         self._visio_service = visio_service
+        self._model_cache = model_cache
 
     def create_irregular_event(self, template: IrregularEventDB) -> int:
         return self._create_template(
@@ -98,7 +101,9 @@ class TemplateService(metaclass=WrapMethodsMeta):
 
     def delete_template(self, template_id: int, model_id: int) -> int:
         self._check_template_rights(template_id, model_id)
-        return self._template_rep.delete_template(template_id)
+        obj_id = self._template_rep.delete_template(template_id)
+        self._model_cache.evict(model_id)
+        return obj_id
 
     def create_template_usage(self, template_usage: TemplateUsageDB) -> int:
         obj_id = self._template_rep.create_template_usage(template_usage)
@@ -132,6 +137,7 @@ class TemplateService(metaclass=WrapMethodsMeta):
                     usage_node_id, resource_node.id, template_usage.model_id
                 )
 
+        self._model_cache.evict(template_usage.model_id)
         return obj_id
 
     def get_template_usage(
@@ -158,11 +164,14 @@ class TemplateService(metaclass=WrapMethodsMeta):
                 obj_id, template_usage.name, self._usage_nodes.get(template_meta.type)
             )
 
+        self._model_cache.evict(template_usage.model_id)
         return obj_id
 
     def delete_template_usage(self, template_usage_id: int, model_id: int) -> int:
         self._check_template_usage_rights(template_usage_id, model_id)
-        return self._template_rep.delete_template_usage(template_usage_id)
+        obj_id = self._template_rep.delete_template_usage(template_usage_id)
+        self._model_cache.evict(model_id)
+        return obj_id
 
     def _update_template(
         self,
@@ -179,6 +188,7 @@ class TemplateService(metaclass=WrapMethodsMeta):
                 obj_id, template.meta.name, self._template_nodes.get(template.meta.type)
             )
 
+        self._model_cache.evict(template.meta.model_id)
         return obj_id
 
     def _check_template_rights(self, template_id: int, model_id: int) -> None:
@@ -210,4 +220,5 @@ class TemplateService(metaclass=WrapMethodsMeta):
                 template.meta.model_id,
             )
 
+        self._model_cache.evict(template.meta.model_id)
         return obj_id
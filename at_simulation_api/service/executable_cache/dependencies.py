@@ -0,0 +1,25 @@
+from typing import Optional, Protocol
+
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.repository.local_cache.repository import LocalFileCache
+from at_simulation_api.repository.minio.repository import MinioRepository
+
+
+class IFileCache(Protocol):
+    def acquire(self, key: str) -> Optional[str]: ...
+
+    def put(self, key: str, file_path: str, pin: bool = False) -> str: ...
+
+    def release(self, key: str) -> None: ...
+
+    def get_stats(self) -> CacheStats: ...
+
+
+_: IFileCache = LocalFileCache(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IFileRepository(Protocol):
+    def fetch_file(self, file_uuid: str, file_path: str) -> str: ...
+
+
+_: IFileRepository = MinioRepository(..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -0,0 +1,72 @@
+import hashlib
+import tempfile
+import threading
+from typing import Dict
+
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.service.executable_cache.dependencies import (
+    IFileCache,
+    IFileRepository,
+)
+
+
+class ExecutableCache:
+    """
+    Local copies of the translated executables, one per file id. Objects are
+    never overwritten under their id, so the id addresses the content.
+    Concurrent requests for the same file share one download, and a file
+    stays pinned in the cache while a process started from it is alive.
+    """
+
+    def __init__(
+        self,
+        file_cache: IFileCache,
+        file_repository: IFileRepository,
+    ):
+        self._file_cache = file_cache
+        self._file_repository = file_repository
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        # requests holding or waiting on each fetch lock
+        self._fetch_waiters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, file_uuid: str) -> str:
+        """Returns the local path of the executable and pins it until ``release``."""
+        key = self._get_key(file_uuid)
+        file_path = self._file_cache.acquire(key)
+        if file_path:
+            return file_path
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+            self._fetch_waiters[key] = self._fetch_waiters.get(key, 0) + 1
+        try:
+            with fetch_lock:
+                # another request may have fetched it while we waited
+                file_path = self._file_cache.acquire(key)
+                if file_path:
+                    return file_path
+
+                with tempfile.TemporaryDirectory() as fetch_dir:
+                    fetched_path = self._file_repository.fetch_file(
+                        file_uuid, fetch_dir
+                    )
+                    return self._file_cache.put(key, fetched_path, pin=True)
+        finally:
+            with self._lock:
+                # dropped by the last one out, so nobody still waiting on it
+                # races a newcomer holding a fresh lock for the same key
+                self._fetch_waiters[key] -= 1
+                if not self._fetch_waiters[key]:
+                    del self._fetch_waiters[key]
+                    del self._fetch_locks[key]
+
+    def release(self, file_uuid: str) -> None:
+        self._file_cache.release(self._get_key(file_uuid))
+
+    def get_stats(self) -> CacheStats:
+        return self._file_cache.get_stats()
+
+    def _get_key(self, file_uuid: str) -> str:
+        # file ids contain slashes, the key has to be a flat file name
+        return hashlib.sha256(file_uuid.encode()).hexdigest()
@@ -0,0 +1,13 @@
+from typing import Protocol, Set
+
+from at_simulation_api.repository.minio.models.models import MinioFile
+from at_simulation_api.repository.minio.repository import MinioRepository
+
+
+class IFileRepository(Protocol):
+    def get_file(self, file_uuid: str) -> MinioFile: ...
+
+    def get_file_names(self) -> Set[str]: ...
+
+
+_: IFileRepository = MinioRepository(..., ...)  # type: ignore[arg-type, reportArgumentType]
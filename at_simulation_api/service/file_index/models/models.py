@@ -0,0 +1,12 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from at_simulation_api.repository.minio.models.models import MinioFile
+
+
+class TranslatedFilesPage(BaseModel):
+    files: List[MinioFile]
+    # number of the user's files across all pages
+    total: int
+    next_cursor: Optional[str] = None
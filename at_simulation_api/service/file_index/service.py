@@ -0,0 +1,111 @@
+import asyncio
+import base64
+import binascii
+import logging
+from datetime import datetime
+from typing import Callable, ContextManager, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from at_simulation_api.core.errors import BadRequestError
+from at_simulation_api.repository.minio.models.models import MinioFile
+from at_simulation_api.repository.translated_file.repository import (
+    TranslatedFileRepository,
+)
+from at_simulation_api.service.file_index.dependencies import IFileRepository
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
+
+logger = logging.getLogger(__name__)
+
+
+class TranslatedFileIndex:
+    """
+    Postgres index of the translated files stored in MinIO, so listing a
+    user's files is one indexed query instead of a stat per bucket object.
+    Uploads are indexed as they happen; ``reconcile`` backfills files that
+    were uploaded without the index and drops rows for deleted objects.
+    Every call runs in its own session since uploads finish after the
+    request that started them.
+    """
+
+    def __init__(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        file_repository: IFileRepository,
+    ):
+        self._session_scope = session_scope
+        self._file_repository = file_repository
+
+    def add_file(self, file: MinioFile) -> None:
+        with self._session_scope() as session:
+            TranslatedFileRepository(session).add_file(file)
+
+    def get_files(
+        self, user_id: int, limit: int, cursor: Optional[str] = None
+    ) -> TranslatedFilesPage:
+        """Newest files first; ``next_cursor`` is set while more files remain."""
+        before = _decode_cursor(cursor) if cursor else None
+        with self._session_scope() as session:
+            repository = TranslatedFileRepository(session)
+            files = repository.get_files(user_id, limit + 1, before)
+            total = repository.count_files(user_id)
+
+        next_cursor = None
+        if len(files) > limit:
+            files = files[:limit]
+            next_cursor = _encode_cursor(files[-1])
+        return TranslatedFilesPage(files=files, total=total, next_cursor=next_cursor)
+
+    def reconcile(self) -> Tuple[int, int]:
+        # the index is read before the bucket is listed: a file indexed in
+        # between is then missing from indexed_ids rather than from
+        # stored_ids, so it is re-added instead of deleted
+        with self._session_scope() as session:
+            indexed_ids = TranslatedFileRepository(session).get_file_ids()
+        stored_ids = self._file_repository.get_file_names()
+
+        added = 0
+        for file_id in stored_ids - indexed_ids:
+            try:
+                self.add_file(self._file_repository.get_file(file_id))
+            except Exception as e:
+                logger.warning(f"Skipping translated file {file_id}: {e}")
+                continue
+            added += 1
+
+        with self._session_scope() as session:
+            removed = TranslatedFileRepository(session).delete_files(
+                indexed_ids - stored_ids
+            )
+
+        return added, removed
+
+    async def run_reconciliation(self, interval: int) -> None:
+        while True:
+            try:
+                added, removed = await asyncio.to_thread(self.reconcile)
+                logger.info(
+                    "Translated file index reconciled",
+                    extra={"details": {"added": added, "removed": removed}},
+                )
+            except Exception as e:
+                logger.error(f"Translated file index reconciliation failed: {e}")
+
+            if interval <= 0:
+                return
+            await asyncio.sleep(interval)
+
+
+def _encode_cursor(file: MinioFile) -> str:
+    raw = f"{file.file_meta.created_at.isoformat()}|{file.minio_name}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, file_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(created_at), file_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError(f"Invalid cursor {cursor}")
@@ -0,0 +1,120 @@
+import asyncio
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from at_simulation_api.core.errors import ForbiddenError, NotFoundError
+from at_simulation_api.repository.editor.function.repository import (
+    AsyncFunctionRepository,
+)
+from at_simulation_api.repository.editor.resource.repository import (
+    AsyncResourceRepository,
+)
+from at_simulation_api.repository.editor.template.repository import (
+    AsyncTemplateRepository,
+)
+from at_simulation_api.repository.model.models.models import ModelMetaDB
+from at_simulation_api.repository.model.repository import AsyncModelRepository
+from at_simulation_api.service.editor.template.models.models import Templates
+from at_simulation_api.service.model.dependencies import IModelCache
+from at_simulation_api.service.model.models.conversions import to_Model
+from at_simulation_api.service.model.models.models import Model
+from at_simulation_api.service.model.service import ModelService
+
+
+class AsyncModelService:
+    """
+    Read side of ModelService for async callers. Each call opens its own
+    AsyncSession, so model loading does not hold a threadpool slot.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        model_cache: IModelCache,
+    ) -> None:
+        self._session_factory = session_factory
+        self._model_cache = model_cache
+
+    async def check_model_rights(self, model_id: int, user_id: int) -> None:
+        async with self._session_factory() as session:
+            meta = await AsyncModelRepository(session).get_model_meta(model_id)
+        self._check_owner(meta, user_id)
+
+    async def get_model(self, model_id: int, user_id: int) -> Model:
+        async with self._session_factory() as session:
+            meta = await AsyncModelRepository(session).get_model_meta(model_id)
+            self._check_owner(meta, user_id)
+            return await self._load_model(session, meta)
+
+    async def get_models_by_ids(
+        self, model_ids: List[int], user_id: int
+    ) -> List[Model]:
+        async with self._session_factory() as session:
+            metas: Dict[int, ModelMetaDB] = {
+                meta.id: meta
+                for meta in await AsyncModelRepository(session).get_model_metas(
+                    model_ids
+                )
+            }
+            for model_id in model_ids:
+                if model_id not in metas:
+                    raise NotFoundError(f"Model {model_id} not found")
+                self._check_owner(metas[model_id], user_id)
+
+            return [
+                await self._load_model(session, metas[model_id])
+                for model_id in model_ids
+            ]
+
+    async def _load_model(self, session: AsyncSession, meta: ModelMetaDB) -> Model:
+        model_id = meta.id
+        model = self._model_cache.get(model_id, meta.revision)
+        if model:
+            return model
+
+        resource_rep = AsyncResourceRepository(session)
+        template_rep = AsyncTemplateRepository(session)
+        function_rep = AsyncFunctionRepository(session)
+
+        resource_types = await resource_rep.get_resource_types(model_id)
+        resources = await resource_rep.get_resources(model_id)
+        templates = Templates(
+            irregular_events=await template_rep.get_irregular_events(model_id),
+            operations=await template_rep.get_operations(model_id),
+            rules=await template_rep.get_rules(model_id),
+        )
+        template_usages = await template_rep.get_template_usages(model_id)
+        functions = await function_rep.get_functions(model_id)
+
+        model = to_Model(
+            meta, resource_types, resources, templates, template_usages, functions
+        )
+        self._model_cache.put(model_id, meta.revision, model)
+        return model
+
+    def _check_owner(self, meta: ModelMetaDB, user_id: int) -> None:
+        if meta.user_id != user_id:
+            raise ForbiddenError(f"Model {meta.id} does not belong to user {user_id}")
+
+
+class ThreadedModelService:
+    """Exposes the sync ModelService reads with the AsyncModelService interface."""
+
+    def __init__(self, model_service: ModelService) -> None:
+        self._model_service = model_service
+
+    async def check_model_rights(self, model_id: int, user_id: int) -> None:
+        await asyncio.to_thread(
+            self._model_service.check_model_rights, model_id, user_id
+        )
+
+    async def get_model(self, model_id: int, user_id: int) -> Model:
+        return await asyncio.to_thread(self._model_service.get_model, model_id, user_id)
+
+    async def get_models_by_ids(
+        self, model_ids: List[int], user_id: int
+    ) -> List[Model]:
+        return await asyncio.to_thread(
+            self._model_service.get_models_by_ids, model_ids, user_id
+        )
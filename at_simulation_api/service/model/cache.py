@@ -0,0 +1,40 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from at_simulation_api.service.model.models.models import Model
+
+
+class ModelCache:
+    """
+    In-process LRU of assembled models keyed by model id and the revision
+    stored on the models row. Repository writes bump that revision, so a
+    cached model is reused only while its revision still matches the DB.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._models: OrderedDict[int, Tuple[int, Model]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model_id: int, revision: int) -> Optional[Model]:
+        with self._lock:
+            entry = self._models.get(model_id)
+            if entry is None or entry[0] != revision:
+                return None
+            self._models.move_to_end(model_id)
+            return entry[1]
+
+    def put(self, model_id: int, revision: int, model: Model) -> None:
+        with self._lock:
+            entry = self._models.get(model_id)
+            if entry is not None and entry[0] > revision:
+                return
+            self._models[model_id] = (revision, model)
+            self._models.move_to_end(model_id)
+            while len(self._models) > self._max_size:
+                self._models.popitem(last=False)
+
+    def evict(self, model_id: int) -> None:
+        with self._lock:
+            self._models.pop(model_id, None)
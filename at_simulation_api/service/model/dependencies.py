@@ -1,4 +1,4 @@
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 
 from at_simulation_api.repository.editor.function.models.models import FunctionDB
 from at_simulation_api.repository.editor.resource.models.models import (
@@ -12,6 +12,8 @@ from at_simulation_api.service.editor.function.service import FunctionService
 from at_simulation_api.service.editor.resource.service import ResourceService
 from at_simulation_api.service.editor.template.models.models import Templates
 from at_simulation_api.service.editor.template.service import TemplateService
+from at_simulation_api.service.model.cache import ModelCache
+from at_simulation_api.service.model.models.models import Model
 
 
 class IModelRepository(Protocol):
@@ -21,6 +23,8 @@ class IModelRepository(Protocol):
 
     def get_models(self, user_id: int) -> List[ModelMetaDB]: ...
 
+    def get_model_metas(self, model_ids: List[int]) -> List[ModelMetaDB]: ...
+
     def update_model(self, model: ModelMetaDB) -> int: ...
 
     def delete_model(self, model_id: int) -> int: ...
@@ -35,14 +39,14 @@ class IResourceService(Protocol):
     def get_resources(self, model_id: int) -> List[ResourceDB]: ...
 
 
-_: IResourceService = ResourceService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IResourceService = ResourceService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IFunctionService(Protocol):
     def get_functions(self, model_id: int) -> List[FunctionDB]: ...
 
 
-_: IFunctionService = FunctionService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IFunctionService = FunctionService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class ITemplateService(Protocol):
@@ -51,4 +55,15 @@ class ITemplateService(Protocol):
     def get_template_usages(self, model_id: int) -> List[TemplateUsageDB]: ...
 
 
-_: ITemplateService = TemplateService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: ITemplateService = TemplateService(..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IModelCache(Protocol):
+    def get(self, model_id: int, revision: int) -> Optional[Model]: ...
+
+    def put(self, model_id: int, revision: int, model: Model) -> None: ...
+
+    def evict(self, model_id: int) -> None: ...
+
+
+_: IModelCache = ModelCache(...)  # type: ignore[arg-type, reportArgumentType]
@@ -1,9 +1,14 @@
 from typing import List
 
-from at_simulation_api.core.errors import ForbiddenError, WrapMethodsMeta
+from at_simulation_api.core.errors import (
+    ForbiddenError,
+    NotFoundError,
+    WrapMethodsMeta,
+)
 from at_simulation_api.repository.model.models.models import ModelMetaDB
 from at_simulation_api.service.model.dependencies import (
     IFunctionService,
+    IModelCache,
     IModelRepository,
     IResourceService,
     ITemplateService,
@@ -19,11 +24,13 @@ class ModelService(metaclass=WrapMethodsMeta):
         resource_service: IResourceService,
         template_service: ITemplateService,
         function_service: IFunctionService,
+        model_cache: IModelCache,
     ) -> None:
         self._model_rep = model_rep
         self._resource_service = resource_service
         self._template_service = template_service
         self._function_service = function_service
+        self._model_cache = model_cache
 
     def check_model_rights(self, model_id: int, user_id: int) -> None:
         model = self._model_rep.get_model_meta(model_id)
@@ -38,22 +45,49 @@ class ModelService(metaclass=WrapMethodsMeta):
 
     def update_model(self, model: ModelMetaDB) -> int:
         self.check_model_rights(model.id, model.user_id)
-        return self._model_rep.update_model(model)
+        obj_id = self._model_rep.update_model(model)
+        self._model_cache.evict(model.id)
+        return obj_id
 
     def delete_model(self, model_id: int, user_id: int) -> int:
         self.check_model_rights(model_id, user_id)
-        return self._model_rep.delete_model(model_id)
+        obj_id = self._model_rep.delete_model(model_id)
+        self._model_cache.evict(model_id)
+        return obj_id
 
     def get_model(self, model_id: int, user_id: int) -> Model:
-        self.check_model_rights(model_id, user_id)
-
         meta = self._model_rep.get_model_meta(model_id)
+        if meta.user_id != user_id:
+            raise ForbiddenError(f"Model {model_id} does not belong to user {user_id}")
+
+        return self._load_model(meta)
+
+    def get_models_by_ids(self, model_ids: List[int], user_id: int) -> List[Model]:
+        metas = {meta.id: meta for meta in self._model_rep.get_model_metas(model_ids)}
+        for model_id in model_ids:
+            if model_id not in metas:
+                raise NotFoundError(f"Model {model_id} not found")
+            if metas[model_id].user_id != user_id:
+                raise ForbiddenError(
+                    f"Model {model_id} does not belong to user {user_id}"
+                )
+
+        return [self._load_model(metas[model_id]) for model_id in model_ids]
+
+    def _load_model(self, meta: ModelMetaDB) -> Model:
+        model_id = meta.id
+        model = self._model_cache.get(model_id, meta.revision)
+        if model:
+            return model
+
         resource_types = self._resource_service.get_resource_types(model_id)
         resources = self._resource_service.get_resources(model_id)
         templates = self._template_service.get_templates(model_id)
         template_usages = self._template_service.get_template_usages(model_id)
         functions = self._function_service.get_functions(model_id)
 
-        return to_Model(
+        model = to_Model(
             meta, resource_types, resources, templates, template_usages, functions
         )
+        self._model_cache.put(model_id, meta.revision, model)
+        return model
@@ -2,6 +2,7 @@ from typing import Protocol
 
 from at_simulation_api.repository.minio.models.models import MinioFile
 from at_simulation_api.repository.minio.repository import MinioRepository
+from at_simulation_api.service.executable_cache.service import ExecutableCache
 from at_simulation_api.service.model.models.models import Model
 from at_simulation_api.service.model.service import ModelService
 
@@ -12,13 +13,20 @@ class IModelService(Protocol):
     def check_model_rights(self, model_id: int, user_id: int) -> None: ...
 
 
-_: IModelService = ModelService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IModelService = ModelService(..., ..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IFileRepository(Protocol):
-    def fetch_file(self, file_uuid: str, file_path: str) -> str: ...
-
     def get_file(self, file_uuid: str) -> MinioFile: ...
 
 
 _: IFileRepository = MinioRepository(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IExecutableCache(Protocol):
+    def acquire(self, file_uuid: str) -> str: ...
+
+    def release(self, file_uuid: str) -> None: ...
+
+
+_: IExecutableCache = ExecutableCache(..., ...)  # type: ignore[arg-type, reportArgumentType]
@@ -1,9 +1,12 @@
-import subprocess
+import asyncio
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from at_simulation_api.service.processor.output import ProcessOutput
+
 
 class ProcessStatus(str, Enum):
     PAUSE = "PAUSE"
@@ -18,7 +21,10 @@ class Process(BaseModel):
     file_uuid: str
     status: ProcessStatus
     current_tick: int
-    process_handle: Optional[subprocess.Popen] = Field(default=None)
+    process_handle: Optional[asyncio.subprocess.Process] = Field(default=None)
+    output: Optional[ProcessOutput] = Field(default=None)
+    stream_task: Optional[asyncio.Task] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
 
     class Config:
         arbitrary_types_allowed = True
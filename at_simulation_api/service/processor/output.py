@@ -0,0 +1,62 @@
+import asyncio
+import json
+import logging
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# a subscriber that falls this far behind starts losing its oldest ticks
+_SUBSCRIBER_QUEUE_SIZE = 1024
+
+
+class ProcessOutput:
+    """
+    The only reader of a process's stdout. Each line is parsed once and
+    published to every subscriber's queue; ``None`` marks the end of the
+    stream. Publishing never waits on a subscriber.
+    """
+
+    def __init__(self, stream: asyncio.StreamReader):
+        self._stream = stream
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._read())
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        if self._closed:
+            queue.put_nowait(None)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    async def _read(self) -> None:
+        try:
+            while True:
+                line = await self._stream.readline()
+                if not line:
+                    break
+
+                try:
+                    tick = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._publish(tick)
+        except Exception as e:
+            logger.error(f"Error reading process output: {e}")
+        finally:
+            self._closed = True
+            self._publish(None)
+
+    def _publish(self, tick: Optional[dict]) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(tick)
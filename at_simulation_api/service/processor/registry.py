@@ -0,0 +1,74 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from at_simulation_api.service.processor.models.models import Process, ProcessStatus
+
+
+class ProcessRegistry:
+    """
+    Processes indexed by id and by owner. Killed or exited processes stay
+    listed for ``ttl`` seconds after they finish and are dropped by ``reap``.
+    """
+
+    def __init__(self, ttl: int):
+        self._ttl = ttl
+        self._processes: Dict[str, Process] = {}
+        self._user_processes: Dict[int, Dict[str, Process]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, process: Process) -> None:
+        with self._lock:
+            self._processes[process.process_id] = process
+            self._user_processes.setdefault(process.user_id, {})[
+                process.process_id
+            ] = process
+
+    def get(self, process_id: str) -> Optional[Process]:
+        return self._processes.get(process_id)
+
+    def get_user_processes(self, user_id: int) -> List[Process]:
+        with self._lock:
+            return list(self._user_processes.get(user_id, {}).values())
+
+    def finish(self, process: Process) -> bool:
+        """
+        Marks the process killed. Returns whether this call finished it, so
+        only one caller releases what the process held.
+        """
+        process.status = ProcessStatus.KILLED
+        if process.finished_at is not None:
+            return False
+        process.finished_at = datetime.now()
+        return True
+
+    def reap(self) -> List[Process]:
+        """
+        Marks processes whose subprocess exited on its own as finished and
+        evicts the ones finished longer than ``ttl`` ago. Returns the
+        processes that were found exited on this call.
+        """
+        now = datetime.now()
+        expired_before = now - timedelta(seconds=self._ttl)
+        exited = []
+
+        with self._lock:
+            for process in list(self._processes.values()):
+                if process.finished_at is None:
+                    handle = process.process_handle
+                    if handle is None or handle.returncode is None:
+                        continue
+                    self.finish(process)
+                    exited.append(process)
+
+                if process.finished_at < expired_before:
+                    self._remove(process)
+
+        return exited
+
+    def _remove(self, process: Process) -> None:
+        del self._processes[process.process_id]
+        user_processes = self._user_processes[process.user_id]
+        del user_processes[process.process_id]
+        if not user_processes:
+            del self._user_processes[process.user_id]
@@ -1,42 +1,60 @@
 import asyncio
 import json
-import os
-import subprocess
+import logging
 import uuid
-from typing import List
+from typing import List, Optional
 
+from at_simulation_api.config.processor import ProcessorStore
 from at_simulation_api.core.errors import ForbiddenError, NotFoundError, WrapMethodsMeta
-from at_simulation_api.service.processor.dependencies import IFileRepository
+from at_simulation_api.service.processor.dependencies import (
+    IExecutableCache,
+    IFileRepository,
+)
 from at_simulation_api.service.processor.models.models import Process, ProcessStatus
+from at_simulation_api.service.processor.output import ProcessOutput
+from at_simulation_api.service.processor.registry import ProcessRegistry
 from at_simulation_api.service.websocket_manager.service import WebsocketManager
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessorService(metaclass=WrapMethodsMeta):
-    _processes: List[Process] = []
+    _create_semaphore: Optional[asyncio.Semaphore] = None
 
     def __init__(
         self,
         file_repository: IFileRepository,
         websocket_manager: WebsocketManager,
+        executable_cache: IExecutableCache,
+        process_registry: ProcessRegistry,
     ) -> None:
         self._file_repository = file_repository
         self._websocket_manager = websocket_manager
+        self._executable_cache = executable_cache
+        self._process_registry = process_registry
 
-    def create_process(
+    async def create_process(
         self, user_id: int, file_uuid: str, process_name: str
     ) -> Process:
-        self._check_file_rights(user_id, file_uuid)
-        file_path = self._file_repository.fetch_file(
-            file_uuid, os.getenv("FETCH_FILE_PATH", "/bin")
-        )
+        # only a few at a time so bulk creation does not starve running
+        # simulations
+        async with self._get_create_semaphore():
+            await asyncio.to_thread(self._check_file_rights, user_id, file_uuid)
+            file_path = await asyncio.to_thread(
+                self._executable_cache.acquire, file_uuid
+            )
 
-        process_handle = subprocess.Popen(
-            [file_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+            try:
+                process_handle = await asyncio.create_subprocess_exec(
+                    file_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=ProcessorStore.get_processor_config().stream_limit,
+                )
+            except Exception:
+                self._executable_cache.release(file_uuid)
+                raise
 
         process_id = str(uuid.uuid4())
 
@@ -48,9 +66,14 @@ class ProcessorService(metaclass=WrapMethodsMeta):
             status=ProcessStatus.PAUSE,
             current_tick=0,
             process_handle=process_handle,
+            output=ProcessOutput(process_handle.stdout),
+        )
+        new_process.output.start()
+        new_process.stream_task = asyncio.create_task(
+            self._stream_to_websocket(new_process)
         )
 
-        self._processes.append(new_process)
+        self._process_registry.add(new_process)
         return new_process
 
     async def run_process(
@@ -60,48 +83,19 @@ class ProcessorService(metaclass=WrapMethodsMeta):
         ticks: int,
         delay: int,
     ) -> Process:
-        self._check_process_rights(user_id, process_id)
-
-        process = self._find_process_by_id(process_id)
-        if not process:
-            raise ValueError("Process not found.")
+        process = self._check_process_rights(user_id, process_id)
 
         if process.status not in [ProcessStatus.PAUSE, ProcessStatus.RUNNING]:
             raise ValueError("Process is not in a valid state to run.")
 
         process.status = ProcessStatus.RUNNING
         try:
-            process.process_handle.stdin.write("RUN\n")
-            process.process_handle.stdin.write(f"{ticks} {delay}\n")
-            process.process_handle.stdin.flush()
+            process.process_handle.stdin.write(b"RUN\n")
+            process.process_handle.stdin.write(f"{ticks} {delay}\n".encode())
+            await process.process_handle.stdin.drain()
         except Exception as e:
             raise RuntimeError(f"Failed to send commands to the process: {e}")
 
-        async def stream_output():
-            try:
-                while True:
-                    line = await asyncio.get_event_loop().run_in_executor(
-                        None, process.process_handle.stdout.readline
-                    )
-                    if not line:
-                        break
-
-                    try:
-                        json_data = json.loads(line.strip())
-                        await self._websocket_manager.send_message(
-                            json.dumps(json_data), user_id, process_id
-                        )
-                    except json.JSONDecodeError:
-                        continue
-                    except Exception as e:
-                        print(f"Error sending message to WebSocket: {e}")
-            except Exception as e:
-                print(f"Error reading process output: {e}")
-            finally:
-                process.process_handle.stdout.close()
-
-        asyncio.create_task(stream_output())
-
         return Process(
             user_id=user_id,
             process_id=process_id,
@@ -117,74 +111,101 @@ class ProcessorService(metaclass=WrapMethodsMeta):
         user_id: int,
         process_id: str,
     ) -> dict:
-        self._check_process_rights(user_id, process_id)
-
-        process = self._find_process_by_id(process_id)
-        if not process:
-            raise ValueError("Process not found.")
+        process = self._check_process_rights(user_id, process_id)
 
         if process.status not in [ProcessStatus.PAUSE, ProcessStatus.RUNNING]:
             raise ValueError("Process is not in a valid state to run.")
 
-        try:
-            process.process_handle.stdin.write("RUN\n")
-            process.process_handle.stdin.write("1 1\n")
-            process.process_handle.stdin.flush()
-        except Exception as e:
-            raise RuntimeError(f"Failed to send commands to the process: {e}")
-
-        try:
-            output = await asyncio.get_event_loop().run_in_executor(
-                None, process.process_handle.stdout.readline
-            )
-            return json.loads(output.strip())
-        except json.JSONDecodeError:
-            raise ValueError("Failed to decode process output as JSON.")
+        # subscribed before the command is sent so the tick cannot be missed
+        with process.output.subscribe() as ticks:
+            try:
+                process.process_handle.stdin.write(b"RUN\n1 1\n")
+                await process.process_handle.stdin.drain()
+            except Exception as e:
+                raise RuntimeError(f"Failed to send commands to the process: {e}")
 
-    def pause_process(self, user_id: int, process_id: str) -> Process:
-        self._check_process_rights(user_id, process_id)
+            tick = await ticks.get()
+            if tick is None:
+                raise ValueError("Process exited before producing a tick.")
+            return tick
 
-        process = self._find_process_by_id(process_id)
+    async def pause_process(self, user_id: int, process_id: str) -> Process:
+        process = self._check_process_rights(user_id, process_id)
         if process.status != ProcessStatus.RUNNING:
             raise ValueError("Process is not currently running.")
 
-        process.process_handle.stdin.write("PAUSE\n")
-        process.process_handle.stdin.flush()
+        process.process_handle.stdin.write(b"PAUSE\n")
+        await process.process_handle.stdin.drain()
         process.status = ProcessStatus.PAUSE
 
         return process
 
-    def kill_process(self, user_id: int, process_id: str) -> Process:
-        self._check_process_rights(user_id, process_id)
-
-        process = self._find_process_by_id(process_id)
+    async def kill_process(self, user_id: int, process_id: str) -> Process:
+        process = self._check_process_rights(user_id, process_id)
         if process.status == ProcessStatus.KILLED:
             raise ValueError("Process is already killed.")
 
-        process.process_handle.stdin.write("KILL\n")
-        process.process_handle.stdin.flush()
-        process.process_handle.terminate()
-        process.status = ProcessStatus.KILLED
+        process_handle = process.process_handle
+        if process_handle.returncode is None:
+            process_handle.stdin.write(b"KILL\n")
+            await process_handle.stdin.drain()
+        # the drain yields, so the process may have exited and been reaped
+        if process_handle.returncode is None:
+            process_handle.terminate()
+        if self._process_registry.finish(process):
+            self._executable_cache.release(process.file_uuid)
 
         return process
 
+    async def _stream_to_websocket(self, process: Process) -> None:
+        with process.output.subscribe() as ticks:
+            while True:
+                tick = await ticks.get()
+                if tick is None:
+                    break
+
+                try:
+                    await self._websocket_manager.send_message(
+                        json.dumps(tick), process.user_id, process.process_id
+                    )
+                except Exception as e:
+                    print(f"Error sending message to WebSocket: {e}")
+
     def get_processes(self, user_id: int) -> List[Process]:
-        return [process for process in self._processes if process.user_id == user_id]
+        return self._process_registry.get_user_processes(user_id)
+
+    async def run_reaper(self, interval: int) -> None:
+        while True:
+            try:
+                for process in self._process_registry.reap():
+                    self._executable_cache.release(process.file_uuid)
+            except Exception:
+                logger.exception("Error reaping processes")
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def _get_create_semaphore(cls) -> asyncio.Semaphore:
+        if cls._create_semaphore is None:
+            cls._create_semaphore = asyncio.Semaphore(
+                ProcessorStore.get_processor_config().max_concurrent_creates
+            )
+        return cls._create_semaphore
 
     def _find_process_by_id(self, process_id: str) -> Process:
-        for process in self._processes:
-            if process.process_id == process_id:
-                return process
-        raise NotFoundError(f"Process {process_id} not found.")
+        process = self._process_registry.get(process_id)
+        if process is None:
+            raise NotFoundError(f"Process {process_id} not found.")
+        return process
 
     def _check_file_rights(self, user_id: int, file_uuid: str):
         file = self._file_repository.get_file(file_uuid)
         if file.file_meta.user_id != user_id:
             raise ForbiddenError(f"File {file_uuid} does not belong to user {user_id}")
 
-    def _check_process_rights(self, user_id: int, process_id: str):
+    def _check_process_rights(self, user_id: int, process_id: str) -> Process:
         process = self._find_process_by_id(process_id)
         if process.user_id != user_id:
             raise ForbiddenError(
                 f"Process {process_id} does not belong to user {user_id}"
             )
+        return process
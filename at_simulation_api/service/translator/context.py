@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from at_simulation_api.repository.editor.resource.models.models import (
+    ResourceDB,
+    ResourceTypeDB,
+)
+from at_simulation_api.repository.editor.template.models.models import (
+    RelevantResourceDB,
+    TemplateMetaDB,
+)
+from at_simulation_api.service.model.models.models import Model
+
+
+@dataclass
+class TranslationContext:
+    """Id lookups built once per model and shared by all fragment translators."""
+
+    resource_types: Dict[int, ResourceTypeDB] = field(default_factory=dict)
+    resources: Dict[int, ResourceDB] = field(default_factory=dict)
+    templates: Dict[int, TemplateMetaDB] = field(default_factory=dict)
+    rel_resources: Dict[int, RelevantResourceDB] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, model: Model) -> "TranslationContext":
+        metas = [
+            template.meta
+            for template in [*model.irregular_events, *model.operations, *model.rules]
+        ]
+        return cls(
+            resource_types={rt.id: rt for rt in model.resource_types},
+            resources={resource.id: resource for resource in model.resources},
+            templates={meta.id: meta for meta in metas},
+            rel_resources={
+                rel_resource.id: rel_resource
+                for meta in metas
+                for rel_resource in meta.rel_resources
+            },
+        )
+
+    def get_resource_type(self, resource_type_id: int) -> Optional[ResourceTypeDB]:
+        return self.resource_types.get(resource_type_id)
+
+    def get_resource(self, resource_id: int) -> Optional[ResourceDB]:
+        return self.resources.get(resource_id)
+
+    def get_template(self, template_id: int) -> Optional[TemplateMetaDB]:
+        return self.templates.get(template_id)
+
+    def get_rel_resource(
+        self, template_id: int, rel_resource_id: int
+    ) -> Optional[RelevantResourceDB]:
+        rel_resource = self.rel_resources.get(rel_resource_id)
+        if rel_resource is None or rel_resource.template_id != template_id:
+            return None
+        return rel_resource
+
+    def get_rel_resources_info(
+        self, meta: TemplateMetaDB
+    ) -> Dict[int, ResourceTypeDB]:
+        rel_resources_info = {}
+        for rel_resource in meta.rel_resources:
+            resource_type = self.get_resource_type(rel_resource.resource_type_id)
+            if resource_type:
+                rel_resources_info[rel_resource.id] = resource_type
+        return rel_resources_info
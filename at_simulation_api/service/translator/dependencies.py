@@ -1,26 +1,83 @@
-from typing import List, Protocol
+from typing import Coroutine, List, Optional, Protocol
 
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.repository.local_cache.repository import LocalFileCache
 from at_simulation_api.repository.minio.models.models import MinioFile
 from at_simulation_api.repository.minio.repository import MinioRepository
 from at_simulation_api.service.model.models.models import Model
-from at_simulation_api.service.model.service import ModelService
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
+from at_simulation_api.service.file_index.service import TranslatedFileIndex
+from at_simulation_api.service.model.async_service import (
+    AsyncModelService,
+    ThreadedModelService,
+)
+from at_simulation_api.service.translator.jobs import TranslationJobManager
+from at_simulation_api.service.translator.models.models import (
+    TranslateInfo,
+    TranslationJob,
+)
 
 
 class IModelService(Protocol):
-    def get_model(self, model_id: int, user_id: int) -> Model: ...
+    async def get_model(self, model_id: int, user_id: int) -> Model: ...
 
-    def check_model_rights(self, model_id: int, user_id: int) -> None: ...
+    async def get_models_by_ids(
+        self, model_ids: List[int], user_id: int
+    ) -> List[Model]: ...
 
+    async def check_model_rights(self, model_id: int, user_id: int) -> None: ...
 
-_: IModelService = ModelService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+_: IModelService = AsyncModelService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IModelService = ThreadedModelService(...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IFileRepository(Protocol):
     def load_file(
         self, user_id: int, file_path: str, file_name: str, model_id: int
-    ) -> str: ...
-
-    def get_files(self, user_id: int) -> List[MinioFile]: ...
+    ) -> MinioFile: ...
 
 
 _: IFileRepository = MinioRepository(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IFileIndex(Protocol):
+    def add_file(self, file: MinioFile) -> None: ...
+
+    def get_files(
+        self, user_id: int, limit: int, cursor: Optional[str] = None
+    ) -> TranslatedFilesPage: ...
+
+
+_: IFileIndex = TranslatedFileIndex(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class ICompileCache(Protocol):
+    def acquire(self, key: str) -> Optional[str]: ...
+
+    def release(self, key: str) -> None: ...
+
+    def put(self, key: str, file_path: str) -> str: ...
+
+    def get_stats(self) -> CacheStats: ...
+
+
+_: ICompileCache = LocalFileCache(..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class ITranslationJobManager(Protocol):
+    async def run(
+        self, coro: Coroutine[None, None, TranslateInfo]
+    ) -> TranslateInfo: ...
+
+    def submit(
+        self,
+        user_id: int,
+        model_id: int,
+        coro: Coroutine[None, None, TranslateInfo],
+    ) -> TranslationJob: ...
+
+    def get_job(self, job_id: str) -> TranslationJob: ...
+
+
+_: ITranslationJobManager = TranslationJobManager(..., ...)  # type: ignore[arg-type, reportArgumentType]
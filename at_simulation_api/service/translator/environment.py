@@ -0,0 +1,63 @@
+import os
+import sys
+from typing import Dict
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+)
+
+from at_simulation_api.config.translator import TranslatorStore
+
+module_dir = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(module_dir, "templates")
+TEMPLATE_NAMES = sorted(
+    name for name in os.listdir(TEMPLATE_DIR) if name.endswith(".jinja")
+)
+
+
+def _create_environment() -> Environment:
+    config = TranslatorStore.get_translator_config()
+
+    loader: BaseLoader = FileSystemLoader(TEMPLATE_DIR)
+    bytecode_cache = None
+    if config.precompiled_templates_dir:
+        loader = ModuleLoader(config.precompiled_templates_dir)
+    elif config.template_bytecode_cache_dir:
+        os.makedirs(config.template_bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(config.template_bytecode_cache_dir)
+
+    return Environment(
+        loader=loader,
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+environment = _create_environment()
+templates: Dict[str, Template] = {
+    name: environment.get_template(name) for name in TEMPLATE_NAMES
+}
+
+
+def get_template(name: str) -> Template:
+    return templates[name]
+
+
+def compile_templates(target: str) -> None:
+    """Compiles the templates into python modules loadable by ModuleLoader."""
+    Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    ).compile_templates(target, zip=None)
+
+
+if __name__ == "__main__":
+    compile_templates(sys.argv[1])
@@ -1,23 +1,20 @@
-import os
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from at_simulation_api.repository.editor.function.models.models import FunctionDB
+from at_simulation_api.service.translator.environment import get_template
+from at_simulation_api.service.translator.memo import fragment_memo
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "function.jinja"
-
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 
 def trnsl_functions(functions: List[FunctionDB]) -> List[str]:
-    rendered_templates = [template.render(function=function) for function in functions]
+    rendered_templates = [
+        fragment_memo.render(
+            TEMPLATE_NAME, function, lambda: template.render(function=function)
+        )
+        for function in functions
+    ]
     return rendered_templates
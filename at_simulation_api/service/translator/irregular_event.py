@@ -1,41 +1,31 @@
-import os
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
-from at_simulation_api.repository.editor.resource.models.models import ResourceTypeDB
 from at_simulation_api.repository.editor.template.models.models import IrregularEventDB
+from at_simulation_api.service.translator.context import TranslationContext
+from at_simulation_api.service.translator.environment import get_template
+from at_simulation_api.service.translator.memo import fragment_memo
 from at_simulation_api.service.translator.utils import preprocess_template_code
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "irregular_event.jinja"
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 
 def trnsl_irregular_events(
-    irregular_events: List[IrregularEventDB], resource_types: List[ResourceTypeDB]
+    irregular_events: List[IrregularEventDB], context: TranslationContext
 ) -> List[str]:
-    def find_resource_type(resource_type_id: int) -> ResourceTypeDB:
-        return next((rt for rt in resource_types if rt.id == resource_type_id), None)
-
     rendered_templates = []
 
     for irregular_event in irregular_events:
-        rel_resources_info = {}
-        for rel_resource in irregular_event.meta.rel_resources:
-            resource_type = find_resource_type(rel_resource.resource_type_id)
-            if resource_type:
-                rel_resources_info[rel_resource.id] = resource_type
-
-        rendered_template = template.render(
-            to_irregular_event_tr(irregular_event, rel_resources_info)
+        rel_resources_info = context.get_rel_resources_info(irregular_event.meta)
+
+        rendered_template = fragment_memo.render(
+            TEMPLATE_NAME,
+            (irregular_event, rel_resources_info),
+            lambda: template.render(
+                to_irregular_event_tr(irregular_event, rel_resources_info)
+            ),
         )
         rendered_templates.append(rendered_template)
 
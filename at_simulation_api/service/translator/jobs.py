@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Coroutine, Dict, Optional, Set
+
+from at_simulation_api.core.errors import Error, NotFoundError
+from at_simulation_api.service.translator.models.models import (
+    JobStatusEnum,
+    TranslateInfo,
+    TranslationJob,
+)
+
+
+class TranslationJobManager:
+    """
+    Runs translation pipelines on the event loop with at most
+    ``max_concurrency`` builds in flight and keeps finished jobs for ``job_ttl``
+    seconds so clients can poll their status.
+    """
+
+    def __init__(self, max_concurrency: int, job_ttl: int):
+        self._max_concurrency = max_concurrency
+        self._job_ttl = job_ttl
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._jobs: Dict[str, TranslationJob] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def run(self, coro: Coroutine[None, None, TranslateInfo]) -> TranslateInfo:
+        async with self._get_semaphore():
+            return await coro
+
+    def submit(
+        self,
+        user_id: int,
+        model_id: int,
+        coro: Coroutine[None, None, TranslateInfo],
+    ) -> TranslationJob:
+        self._purge_finished_jobs()
+
+        job = TranslationJob(
+            job_id=str(uuid.uuid4()),
+            user_id=user_id,
+            model_id=model_id,
+            status=JobStatusEnum.PENDING,
+            created_at=datetime.now(),
+        )
+        self._jobs[job.job_id] = job
+
+        task = asyncio.create_task(self._execute(job, coro))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return job
+
+    def get_job(self, job_id: str) -> TranslationJob:
+        job = self._jobs.get(job_id)
+        if not job:
+            raise NotFoundError(f"Translation job {job_id} not found.")
+        return job
+
+    async def _execute(
+        self, job: TranslationJob, coro: Coroutine[None, None, TranslateInfo]
+    ) -> None:
+        try:
+            async with self._get_semaphore():
+                job.status = JobStatusEnum.RUNNING
+                job.result = await coro
+            job.status = JobStatusEnum.COMPLETED
+        except Error as e:
+            job.status = JobStatusEnum.FAILED
+            job.error = e.to_dict()
+        except Exception as e:
+            job.status = JobStatusEnum.FAILED
+            job.error = {"error": str(e)}
+        finally:
+            job.finished_at = datetime.now()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    def _purge_finished_jobs(self) -> None:
+        expired_before = datetime.now() - timedelta(seconds=self._job_ttl)
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at and job.finished_at < expired_before
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -1,8 +1,8 @@
-import os
-
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from at_simulation_api.service.model.models.models import Model
+from at_simulation_api.service.translator.context import TranslationContext
+from at_simulation_api.service.translator.environment import get_template
 from at_simulation_api.service.translator.function import trnsl_functions
 from at_simulation_api.service.translator.irregular_event import trnsl_irregular_events
 from at_simulation_api.service.translator.operation import trnsl_operations
@@ -11,36 +11,20 @@ from at_simulation_api.service.translator.resource_type import trnsl_resource_ty
 from at_simulation_api.service.translator.rule import trnsl_rules
 from at_simulation_api.service.translator.template_usage import trnsl_template_usages
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "main.jinja"
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 
 def trnsl_model(model: Model) -> str:
+    context = TranslationContext.from_model(model)
+
     resource_types = trnsl_resource_types(model.resource_types)
-    resources = trnsl_resources(model.resources, model.resource_types)
+    resources = trnsl_resources(model.resources, context)
     functions = trnsl_functions(model.functions)
-    rules = trnsl_rules(model.rules, model.resource_types)
-    operations = trnsl_operations(model.operations, model.resource_types)
-    irregular_events = trnsl_irregular_events(
-        model.irregular_events, model.resource_types
-    )
-
-    metas = []
-    metas.extend([template.meta for template in model.irregular_events])
-    metas.extend([template.meta for template in model.operations])
-    metas.extend([template.meta for template in model.rules])
-    metas = sorted(metas, key=lambda metas: metas.name)
-    template_usages = trnsl_template_usages(
-        model.template_usages, metas, model.resources
-    )
+    rules = trnsl_rules(model.rules, context)
+    operations = trnsl_operations(model.operations, context)
+    irregular_events = trnsl_irregular_events(model.irregular_events, context)
+    template_usages = trnsl_template_usages(model.template_usages, context)
 
     rendered_template = template.render(
         resource_types=resource_types,
@@ -53,3 +37,16 @@ def trnsl_model(model: Model) -> str:
     )
 
     return rendered_template
+
+
+def trnsl_skeleton() -> str:
+    """Renders the main template for an empty model."""
+    return template.render(
+        resource_types=[],
+        resources=[],
+        functions=[],
+        rules=[],
+        operations=[],
+        irregular_events=[],
+        template_usages=[],
+    )
@@ -0,0 +1,71 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from pydantic_core import to_json
+
+from at_simulation_api.config.translator import TranslatorStore
+from at_simulation_api.service.translator.environment import (
+    TEMPLATE_DIR,
+    TEMPLATE_NAMES,
+)
+
+# Bump when a fragment translator changes how it maps DB content to Go code.
+RENDER_VERSION = "1"
+
+
+def _get_version_stamp() -> str:
+    digest = hashlib.sha256(RENDER_VERSION.encode())
+    for name in TEMPLATE_NAMES:
+        with open(os.path.join(TEMPLATE_DIR, name), "rb") as template_file:
+            digest.update(name.encode())
+            digest.update(template_file.read())
+    return digest.hexdigest()
+
+
+class FragmentMemo:
+    """
+    LRU of rendered Go fragments keyed by the fragment kind, the DB content it
+    was rendered from and a stamp of the templates, so editing one template
+    only re-renders the fragments that depend on it.
+    """
+
+    def __init__(self, max_size: int, version: str):
+        self._max_size = max_size
+        self._version = version
+        self._fragments: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, kind: str, content: Any, render: Callable[[], str]) -> str:
+        key = self._get_key(kind, content)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                return fragment
+
+        fragment = render()
+
+        with self._lock:
+            self._fragments[key] = fragment
+            while len(self._fragments) > self._max_size:
+                self._fragments.popitem(last=False)
+
+        return fragment
+
+    def _get_key(self, kind: str, content: Any) -> str:
+        digest = hashlib.sha256()
+        digest.update(self._version.encode())
+        digest.update(b"\0")
+        digest.update(kind.encode())
+        digest.update(b"\0")
+        digest.update(to_json(content))
+        return digest.hexdigest()
+
+
+fragment_memo = FragmentMemo(
+    TranslatorStore.get_translator_config().fragment_memo_size,
+    _get_version_stamp(),
+)
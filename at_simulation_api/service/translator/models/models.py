@@ -1,4 +1,6 @@
+from datetime import datetime
 from enum import Enum
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
@@ -15,3 +17,28 @@ class TranslateInfo(BaseModel):
     file_content: str
     translate_logs: str
     stage: StagesEnum
+    stage_timings: Dict[str, float] = {}
+
+
+class JobStatusEnum(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class TranslationJob(BaseModel):
+    job_id: str
+    user_id: int
+    model_id: int
+    status: JobStatusEnum
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[TranslateInfo] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class BatchTranslationItem(BaseModel):
+    model_id: int
+    result: Optional[TranslateInfo] = None
+    error: Optional[Dict[str, Any]] = None
@@ -1,38 +1,33 @@
-import os
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from at_simulation_api.repository.editor.resource.models.models import (
     ResourceAttributeDB,
     ResourceDB,
     ResourceTypeDB,
 )
+from at_simulation_api.service.translator.context import TranslationContext
+from at_simulation_api.service.translator.environment import get_template
+from at_simulation_api.service.translator.memo import fragment_memo
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "resource.jinja"
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 
 def trnsl_resources(
-    resources: List[ResourceDB], resource_types: List[ResourceTypeDB]
+    resources: List[ResourceDB], context: TranslationContext
 ) -> List[str]:
-    def find_resource_type(resource_type_id: int) -> ResourceTypeDB:
-        return next((rt for rt in resource_types if rt.id == resource_type_id), None)
-
     rendered_templates = []
 
     for resource in resources:
-        resource_type = find_resource_type(resource.resource_type_id)
+        resource_type = context.get_resource_type(resource.resource_type_id)
 
-        rendered_template = template.render(to_resource_tr(resource, resource_type))
+        rendered_template = fragment_memo.render(
+            TEMPLATE_NAME,
+            (resource, resource_type),
+            lambda: template.render(to_resource_tr(resource, resource_type)),
+        )
         rendered_templates.append(rendered_template)
 
     return rendered_templates
@@ -48,12 +43,11 @@ def to_resource_tr(resource: ResourceDB, resource_type: ResourceTypeDB) -> dict:
             return ra.value.upper()
         return ra.value
 
+    resource_attributes = {ra.rta_id: ra for ra in resource.attributes}
     attrs = [
         {
             "name": attr.name,
-            "value": _process_value(
-                next((ra for ra in resource.attributes if ra.rta_id == attr.id), None)
-            ),
+            "value": _process_value(resource_attributes.get(attr.id)),
         }
         for attr in resource_type.attributes
     ]
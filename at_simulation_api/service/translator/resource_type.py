@@ -1,20 +1,13 @@
-import os
 from typing import Dict, List
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from at_simulation_api.repository.editor.resource.models.models import ResourceTypeDB
+from at_simulation_api.service.translator.environment import get_template
+from at_simulation_api.service.translator.memo import fragment_memo
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "resource_type.jinja"
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 TYPE_MAPPING: Dict[str, str] = {
     "INT": "int",
@@ -25,9 +18,13 @@ TYPE_MAPPING: Dict[str, str] = {
 
 def trnsl_resource_types(resource_types: List[ResourceTypeDB]) -> List[str]:
     rendered_templates = [
-        template.render(
-            resource_type=to_resource_type_tr(resource_type),
-            enums=_collect_enums(resource_type),
+        fragment_memo.render(
+            TEMPLATE_NAME,
+            resource_type,
+            lambda: template.render(
+                resource_type=to_resource_type_tr(resource_type),
+                enums=_collect_enums(resource_type),
+            ),
         )
         for resource_type in resource_types
     ]
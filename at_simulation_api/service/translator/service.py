@@ -1,108 +1,195 @@
+import asyncio
+import hashlib
+import logging
 import os
+import signal
 import subprocess
 import tempfile
-from typing import List, Tuple
+import time
+from typing import AsyncIterator, Coroutine, Dict, List, Optional, Tuple
 
-from at_simulation_api.core.errors import BadRequestError, Error, WrapMethodsMeta
-from at_simulation_api.repository.minio.models.models import MinioFile
+from at_simulation_api.config.translator import TranslatorStore
+from at_simulation_api.core.errors import (
+    BadRequestError,
+    Error,
+    ForbiddenError,
+    WrapMethodsMeta,
+)
+from at_simulation_api.repository.local_cache.models.models import CacheStats
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
 from at_simulation_api.service.translator.dependencies import (
+    ICompileCache,
+    IFileIndex,
     IFileRepository,
     IModelService,
+    ITranslationJobManager,
+)
+from at_simulation_api.service.translator.main import trnsl_model, trnsl_skeleton
+from at_simulation_api.service.model.models.models import Model
+from at_simulation_api.service.translator.models.models import (
+    BatchTranslationItem,
+    StagesEnum,
+    TranslateInfo,
+    TranslationJob,
 )
-from at_simulation_api.service.translator.main import trnsl_model
-from at_simulation_api.service.translator.models.models import StagesEnum, TranslateInfo
+
+logger = logging.getLogger(__name__)
 
 
 class TranslatorService(metaclass=WrapMethodsMeta):
+    _toolchain_version: Optional[str] = None
+
     def __init__(
         self,
         model_service: IModelService,
         file_repository: IFileRepository,
+        compile_cache: ICompileCache,
+        job_manager: ITranslationJobManager,
+        file_index: IFileIndex,
     ) -> None:
         self._model_service = model_service
         self._file_repository = file_repository
+        self._compile_cache = compile_cache
+        self._job_manager = job_manager
+        self._file_index = file_index
 
-    def translate_model(
+    async def translate_model(
         self, model_id: int, user_id: int, file_name: str
     ) -> TranslateInfo:
-        self._model_service.check_model_rights(model_id, user_id)
-        model = self._model_service.get_model(model_id, user_id)
-        rendered_model = trnsl_model(model)
+        rendered_model = await self._render_model(model_id, user_id)
+        return await self._job_manager.run(
+            self._compile(rendered_model, model_id, user_id, file_name)
+        )
 
-        print(rendered_model)
+    async def submit_translation(
+        self, model_id: int, user_id: int, file_name: str
+    ) -> TranslationJob:
+        rendered_model = await self._render_model(model_id, user_id)
+        return self._job_manager.submit(
+            user_id,
+            model_id,
+            self._compile(rendered_model, model_id, user_id, file_name),
+        )
+
+    async def translate_models(
+        self, model_ids: List[int], user_id: int, file_name: str
+    ) -> AsyncIterator[BatchTranslationItem]:
+        """
+        Loads all models up front, so rights and missing models fail the whole
+        request, then compiles them through the bounded build pool and yields
+        per-model results in completion order.
+        """
+        model_ids = list(dict.fromkeys(model_ids))
+        max_batch_size = TranslatorStore.get_translator_config().max_batch_size
+        if not model_ids:
+            raise BadRequestError("No models to translate")
+        if len(model_ids) > max_batch_size:
+            raise BadRequestError(
+                f"Cannot translate more than {max_batch_size} models at once"
+            )
 
-        translate_logs = ""
-        temporary_files = []
+        models = await self._model_service.get_models_by_ids(model_ids, user_id)
+        return self._translate_batch(models, user_id, file_name)
+
+    async def _translate_batch(
+        self, models: List[Model], user_id: int, file_name: str
+    ) -> AsyncIterator[BatchTranslationItem]:
+        tasks = [
+            asyncio.create_task(self._translate_batch_item(model, user_id, file_name))
+            for model in models
+        ]
         try:
-            with tempfile.NamedTemporaryFile(
-                suffix=".go",
-                mode="w+",
-                delete=False,
-            ) as go_file:
-                go_file.write(rendered_model)
-                go_file.flush()
-                go_file.close()
-                temporary_files.append(go_file.name)
-
-                # Stage 1: Formatting
-                fmt_result, logs = self._run_formatting(go_file.name)
-                translate_logs += logs
-                if fmt_result != 0:
-                    self._cleanup_files(temporary_files)
-                    raise BadRequestError(
-                        "Failed to translate",
-                        error_details=TranslateInfo(
-                            file_name="",
-                            file_content=rendered_model,
-                            translate_logs=translate_logs,
-                            stage=StagesEnum.FORMATTING,
-                        ).model_dump(),
-                    )
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-                # Stage 2: Building
-                file_path = os.path.join(tempfile.gettempdir(), "compiled_program")
-                build_result, logs = self._run_building(go_file.name, file_path)
-                translate_logs += logs
-                temporary_files.append(file_path)
-                if build_result != 0:
-                    self._cleanup_files(temporary_files)
-                    raise BadRequestError(
-                        "Failed to translate",
-                        error_details=TranslateInfo(
-                            file_name="",
-                            file_content=rendered_model,
-                            translate_logs=translate_logs,
-                            stage=StagesEnum.BUILDING,
-                        ).model_dump(),
-                    )
+    async def _translate_batch_item(
+        self, model: Model, user_id: int, file_name: str
+    ) -> BatchTranslationItem:
+        model_id = model.meta.id
+        try:
+            rendered_model = await asyncio.to_thread(trnsl_model, model)
+            result = await self._job_manager.run(
+                self._compile(rendered_model, model_id, user_id, file_name)
+            )
+            return BatchTranslationItem(model_id=model_id, result=result)
+        except Error as e:
+            return BatchTranslationItem(model_id=model_id, error=e.to_dict())
+        except Exception as e:
+            return BatchTranslationItem(model_id=model_id, error={"error": str(e)})
 
-                # Stage 3: Linting
-                lint_result, logs = self._run_linting(go_file.name)
-                translate_logs += logs
-                if lint_result != 0:
-                    self._cleanup_files(temporary_files)
-                    raise BadRequestError(
-                        "Failed to translate",
-                        error_details=TranslateInfo(
-                            file_name="",
-                            file_content=rendered_model,
-                            translate_logs=translate_logs,
-                            stage=StagesEnum.LINTING,
-                        ).model_dump(),
+    def get_translation_job(self, job_id: str, user_id: int) -> TranslationJob:
+        job = self._job_manager.get_job(job_id)
+        if job.user_id != user_id:
+            raise ForbiddenError(
+                f"Translation job {job_id} does not belong to user {user_id}"
+            )
+        return job
+
+    async def _render_model(self, model_id: int, user_id: int) -> str:
+        model = await self._model_service.get_model(model_id, user_id)
+        rendered_model = await asyncio.to_thread(trnsl_model, model)
+
+        print(rendered_model)
+
+        return rendered_model
+
+    async def _compile(
+        self, rendered_model: str, model_id: int, user_id: int, file_name: str
+    ) -> TranslateInfo:
+        cache_key = await asyncio.to_thread(self._get_cache_key, rendered_model)
+        # pinned so a concurrent put cannot evict it before the upload reads it
+        cached_file_path = await asyncio.to_thread(
+            self._compile_cache.acquire, cache_key
+        )
+        if cached_file_path:
+            try:
+                storage_file_name = await self._upload(
+                    user_id, cached_file_path, file_name, model_id
+                )
+            finally:
+                await asyncio.to_thread(self._compile_cache.release, cache_key)
+            return TranslateInfo(
+                file_name=storage_file_name,
+                file_content=rendered_model,
+                translate_logs="Build skipped: compile cache hit.\n"
+                "\nTranslation completed successfully.",
+                stage=StagesEnum.COMPLETED,
+            )
+
+        try:
+            # Every translation gets its own workspace so concurrent builds never
+            # share source or output paths; GOCACHE is shared between them.
+            with tempfile.TemporaryDirectory(prefix="at_translate_") as workspace:
+                stage_timings: Dict[str, float] = {}
+                file_path, failed_stage, translate_logs = await self._build(
+                    rendered_model, workspace, stage_timings
+                )
+                if failed_stage:
+                    raise self._translate_error(
+                        rendered_model,
+                        translate_logs,
+                        failed_stage,
+                        stage_timings,
                     )
 
+                await asyncio.to_thread(self._store_in_cache, cache_key, file_path)
+
                 # Stage 4: Upload
-                storage_file_name = self._file_repository.load_file(
-                    user_id, file_path, file_name, model.meta.id
+                storage_file_name = await self._upload(
+                    user_id, file_path, file_name, model_id
                 )
                 translate_logs += "\nTranslation completed successfully."
-                self._cleanup_files(temporary_files)
 
                 return TranslateInfo(
                     file_name=storage_file_name,
                     file_content=rendered_model,
                     translate_logs=translate_logs,
                     stage=StagesEnum.COMPLETED,
+                    stage_timings=stage_timings,
                 )
 
         except Error as e:
@@ -111,52 +198,212 @@ class TranslatorService(metaclass=WrapMethodsMeta):
         except Exception as e:
             raise ValueError(e)
 
-    def _run_formatting(self, file_path: str) -> Tuple[int, str]:
-        try:
-            result = subprocess.run(
-                ["goimports", "-w", file_path],
-                capture_output=True,
-                text=True,
-                check=False,
+    async def _upload(
+        self, user_id: int, file_path: str, file_name: str, model_id: int
+    ) -> str:
+        file = await asyncio.to_thread(
+            self._file_repository.load_file, user_id, file_path, file_name, model_id
+        )
+        await asyncio.to_thread(self._file_index.add_file, file)
+        return file.minio_name
+
+    async def warm_up(self) -> float:
+        """
+        Builds and lints an empty model so the shared GOCACHE and lint cache
+        already hold the standard library before the first user translation.
+        Returns the elapsed time in seconds.
+        """
+        started_at = time.perf_counter()
+        with tempfile.TemporaryDirectory(prefix="at_warm_up_") as workspace:
+            _, failed_stage, logs = await self._build(
+                trnsl_skeleton(), workspace, {}
             )
-            logs = result.stdout + result.stderr
-            return result.returncode, logs
+        if failed_stage:
+            logger.warning(f"Translator warm-up failed at {failed_stage.value}: {logs}")
+        return time.perf_counter() - started_at
+
+    async def _build(
+        self, rendered_model: str, workspace: str, stage_timings: Dict[str, float]
+    ) -> Tuple[str, Optional[StagesEnum], str]:
+        go_file_path = os.path.join(workspace, "main.go")
+        with open(go_file_path, "w") as go_file:
+            go_file.write(rendered_model)
+
+        # Stage 1: Formatting
+        fmt_result, translate_logs = await self._run_stage(
+            StagesEnum.FORMATTING,
+            self._run_formatting(go_file_path),
+            stage_timings,
+        )
+        if fmt_result != 0:
+            return "", StagesEnum.FORMATTING, translate_logs
+
+        # Stages 2 and 3: Building and linting both read only the formatted
+        # source, so they run concurrently.
+        file_path = os.path.join(workspace, "compiled_program")
+        failed_stage, logs = await self._run_concurrent_stages(
+            {
+                StagesEnum.BUILDING: self._run_building(go_file_path, file_path),
+                StagesEnum.LINTING: self._run_linting(go_file_path),
+            },
+            stage_timings,
+        )
+        return file_path, failed_stage, translate_logs + logs
+
+    def get_compile_cache_stats(self) -> CacheStats:
+        return self._compile_cache.get_stats()
+
+    def _get_cache_key(self, rendered_model: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(self._get_toolchain_version().encode())
+        digest.update(b"\0")
+        digest.update(rendered_model.encode())
+        return digest.hexdigest()
+
+    def _get_toolchain_version(self) -> str:
+        if TranslatorService._toolchain_version is None:
+            versions = []
+            for command in (["go", "version"], ["golangci-lint", "--version"]):
+                try:
+                    result = subprocess.run(
+                        command, capture_output=True, text=True, check=False
+                    )
+                    versions.append(result.stdout.strip())
+                except Exception:
+                    versions.append("")
+            TranslatorService._toolchain_version = "\n".join(versions)
+        return TranslatorService._toolchain_version
+
+    def _store_in_cache(self, cache_key: str, file_path: str) -> None:
+        try:
+            self._compile_cache.put(cache_key, file_path)
+        except Exception as e:
+            logger.warning(f"Failed to store compiled program in cache: {e}")
+
+    def _translate_error(
+        self,
+        rendered_model: str,
+        translate_logs: str,
+        stage: StagesEnum,
+        stage_timings: Dict[str, float],
+    ) -> BadRequestError:
+        return BadRequestError(
+            "Failed to translate",
+            error_details=TranslateInfo(
+                file_name="",
+                file_content=rendered_model,
+                translate_logs=translate_logs,
+                stage=stage,
+                stage_timings=stage_timings,
+            ).model_dump(),
+        )
+
+    async def _run_stage(
+        self,
+        stage: StagesEnum,
+        coro: Coroutine[None, None, Tuple[int, str]],
+        stage_timings: Dict[str, float],
+    ) -> Tuple[int, str]:
+        started_at = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            stage_timings[stage.value] = time.perf_counter() - started_at
+
+    async def _run_concurrent_stages(
+        self,
+        stages: Dict[StagesEnum, Coroutine[None, None, Tuple[int, str]]],
+        stage_timings: Dict[str, float],
+    ) -> Tuple[Optional[StagesEnum], str]:
+        tasks = {
+            stage: asyncio.create_task(self._run_stage(stage, coro, stage_timings))
+            for stage, coro in stages.items()
+        }
+
+        failed_stage = None
+        pending = set(tasks.values())
+        try:
+            while pending and not failed_stage:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                failed_stage = next(
+                    (
+                        stage
+                        for stage, task in tasks.items()
+                        if task in done and task.result()[0] != 0
+                    ),
+                    None,
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logs = ""
+        for stage, task in tasks.items():
+            if task.cancelled():
+                logs += f"{stage.value} cancelled: {failed_stage.value} failed.\n"
+            else:
+                logs += task.result()[1]
+
+        return failed_stage, logs
+
+    async def _run_formatting(self, file_path: str) -> Tuple[int, str]:
+        try:
+            return await self._run_command(["goimports", "-w", file_path])
         except Exception as e:
             return 1, f"Error during formatting: {str(e)}\n"
 
-    def _run_building(self, file_path: str, output_path: str) -> Tuple[int, str]:
+    async def _run_building(self, file_path: str, output_path: str) -> Tuple[int, str]:
         try:
-            result = subprocess.run(
-                ["go", "build", "-o", output_path, file_path],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            logs = result.stdout + result.stderr
-            return result.returncode, logs
+            return await self._run_command(["go", "build", "-o", output_path, file_path])
         except Exception as e:
             return 1, f"Error during building: {str(e)}\n"
 
-    def _run_linting(self, file_path: str) -> Tuple[int, str]:
+    async def _run_linting(self, file_path: str) -> Tuple[int, str]:
         try:
-            result = subprocess.run(
-                ["golangci-lint", "run", file_path],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            logs = result.stdout + result.stderr
-            return result.returncode, logs
+            return await self._run_command(["golangci-lint", "run", file_path])
         except Exception as e:
             return 1, f"Error during linting: {str(e)}\n"
 
-    def _cleanup_files(self, files: list):
-        for file in files:
+    async def _run_command(self, command: List[str]) -> Tuple[int, str]:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            env=self._get_build_env(),
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # go build and golangci-lint spawn their own workers, kill the whole group.
             try:
-                if os.path.exists(file):
-                    os.remove(file)
-            except Exception as e:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
                 pass
+            await process.wait()
+            raise
+        logs = stdout.decode(errors="replace") + stderr.decode(errors="replace")
+        return process.returncode, logs
+
+    def _get_build_env(self) -> Dict[str, str]:
+        config = TranslatorStore.get_translator_config()
+        return {
+            **os.environ,
+            "GOCACHE": config.go_cache_dir,
+            "GOLANGCI_LINT_CACHE": config.lint_cache_dir,
+        }
 
-    def get_translated_files(self, user_id: int) -> List[MinioFile]:
-        return self._file_repository.get_files(user_id)
+    def get_translated_files(
+        self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TranslatedFilesPage:
+        config = TranslatorStore.get_translator_config()
+        if limit is None:
+            limit = config.files_page_size
+        if not 0 < limit <= config.max_files_page_size:
+            raise BadRequestError(
+                f"Page size must be between 1 and {config.max_files_page_size}"
+            )
+        return self._file_index.get_files(user_id, limit, cursor)
@@ -1,54 +1,33 @@
-import os
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
-from at_simulation_api.repository.editor.resource.models.models import ResourceDB
 from at_simulation_api.repository.editor.template.models.models import (
-    RelevantResourceDB,
     TemplateMetaDB,
     TemplateUsageDB,
 )
+from at_simulation_api.service.translator.context import TranslationContext
+from at_simulation_api.service.translator.environment import get_template
+from at_simulation_api.service.translator.memo import fragment_memo
 
-module_dir = os.path.dirname(os.path.abspath(__file__))
-TEMPLATE_DIR = os.path.join(module_dir, "templates")
 TEMPLATE_NAME = "template_usage.jinja"
-
-current_env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-template: Template = current_env.get_template(TEMPLATE_NAME)
+template: Template = get_template(TEMPLATE_NAME)
 
 
 def trnsl_template_usages(
     template_usages: List[TemplateUsageDB],
-    templates: List[TemplateMetaDB],
-    resources: List[ResourceDB],
+    context: TranslationContext,
 ) -> List[str]:
-    def find_resource(resource_id: int) -> ResourceDB:
-        return next((r for r in resources if r.id == resource_id), None)
-
-    def find_template(template_id: int) -> TemplateMetaDB:
-        return next((t for t in templates if t.id == template_id), None)
-
-    def find_relevant_resource(
-        relevant_resource_id: int, rel_resources: List[RelevantResourceDB]
-    ) -> RelevantResourceDB:
-        return next((r for r in rel_resources if r.id == relevant_resource_id), None)
-
     rendered_templates = []
 
     for template_usage in template_usages:
-        tmpl = find_template(template_usage.template_id)
+        tmpl = context.get_template(template_usage.template_id)
 
         args_info = {}
         for arg in template_usage.arguments:
-            resource = find_resource(arg.resource_id)
-            relevant_resource = find_relevant_resource(
-                arg.relevant_resource_id,
-                tmpl.rel_resources,
+            resource = context.get_resource(arg.resource_id)
+            relevant_resource = context.get_rel_resource(
+                tmpl.id, arg.relevant_resource_id
             )
             if resource:
                 args_info[arg.id] = {
@@ -56,8 +35,12 @@ def trnsl_template_usages(
                     "relevant_resource": relevant_resource,
                 }
 
-        rendered_template = template.render(
-            to_template_usage_tr(template_usage, tmpl, args_info)
+        rendered_template = fragment_memo.render(
+            TEMPLATE_NAME,
+            (template_usage, tmpl, args_info),
+            lambda: template.render(
+                to_template_usage_tr(template_usage, tmpl, args_info)
+            ),
         )
         rendered_templates.append(rendered_template)
 
@@ -1,19 +1,27 @@
 import re
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, List, Pattern
 
 
 def preprocess_template_code(code: str, params: List[str]) -> str:
+    if not params:
+        return code
+
+    param_pattern = _get_param_pattern(frozenset(params))
+    return param_pattern.sub(_replace_param, code)
+
+
+@lru_cache(maxsize=256)
+def _get_param_pattern(params: FrozenSet[str]) -> Pattern[str]:
     sorted_params = sorted(params, key=len, reverse=True)
 
-    param_pattern = (
+    return re.compile(
         r"(?<![\w.\"\'])("
         + "|".join(re.escape(param) for param in sorted_params)
         + r")(?![\w])"
     )
 
-    def replace_param(match):
-        param_name = match.group(1)
-        return f"t.{param_name}"
 
-    new_code = re.sub(param_pattern, replace_param, code)
-    return new_code
+def _replace_param(match: re.Match) -> str:
+    param_name = match.group(1)
+    return f"t.{param_name}"
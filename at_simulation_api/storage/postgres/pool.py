@@ -0,0 +1,58 @@
+import threading
+import time
+
+from pydantic import BaseModel
+from sqlalchemy import exc
+from sqlalchemy.pool import PoolProxiedConnection, QueuePool
+
+
+class PoolStats(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to check out a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._stats_lock = threading.Lock()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+
+        wait_time = time.perf_counter() - start
+        with self._stats_lock:
+            self._checkouts += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+        return connection
+
+    def get_stats(self) -> PoolStats:
+        with self._stats_lock:
+            return PoolStats(
+                size=self.size(),
+                checked_in=self.checkedin(),
+                checked_out=self.checkedout(),
+                overflow=self.overflow(),
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_time_total=self._wait_time_total,
+                wait_time_max=self._wait_time_max,
+            )
@@ -1,11 +1,28 @@
-from typing import Generator
+from contextlib import contextmanager
+from typing import Generator, Iterator, cast
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from at_simulation_api.config.postgres import PostgresStore
+from at_simulation_api.storage.postgres.pool import InstrumentedQueuePool
 
-engine = create_engine(PostgresStore.get_database_config().url, echo=True)
+
+def _create_engine() -> Engine:
+    config = PostgresStore.get_database_config()
+    return create_engine(
+        config.url,
+        echo=config.echo,
+        poolclass=InstrumentedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+    )
+
+
+engine = _create_engine()
 SessionLocal = sessionmaker(autoflush=False, bind=engine)
 
 
@@ -23,6 +40,24 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Unit of work outside of a request: commits on success, rolls back on error."""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+
+def get_db_pool() -> InstrumentedQueuePool:
+    return cast(InstrumentedQueuePool, engine.pool)
+
+
 def dispose_engine():
     if engine:
         engine.dispose()
@@ -1,15 +1,23 @@
 from inspect import signature, Parameter
 import asyncio
+import sys
+from contextlib import asynccontextmanager
 from functools import wraps
 
-async def resolve_dependency(dependency):
+async def resolve_dependency(dependency, overrides=None):
     """
     Recursively resolves a dependency, handling both Depends instances and callable dependencies.
+    Dependencies found in ``overrides`` are replaced by the given values.
     """
+    overrides = overrides or {}
+
     # Check if it's a Depends instance (without using isinstance)
     if hasattr(dependency, 'dependency') and hasattr(dependency, 'use_cache'):
         # This is the safest way to identify a Depends instance
         dependency = dependency.dependency
+
+    if dependency in overrides:
+        return overrides[dependency]
     
     if callable(dependency):
         # Get the function signature
@@ -21,7 +29,7 @@ async def resolve_dependency(dependency):
             # Handle parameters with Depends defaults
             param_default = param.default
             if hasattr(param_default, 'dependency') and hasattr(param_default, 'use_cache'):
-                kwargs[name] = await resolve_dependency(param_default)
+                kwargs[name] = await resolve_dependency(param_default, overrides)
             # Handle parameters with no defaults but type annotations
             elif param.default is Parameter.empty and param.annotation is not Parameter.empty:
                 # You might want to add special cases here if needed
@@ -34,4 +42,25 @@ async def resolve_dependency(dependency):
         return result
     
     # If it's not callable and not a Depends, return as-is
-    return dependency
\ No newline at end of file
+    return dependency
+
+
+@asynccontextmanager
+async def resolve_scoped_dependency(dependency):
+    """
+    Resolves a dependency with its own DB session, committed when the scope exits.
+    Used outside of FastAPI requests, e.g. by the worker, so every call gets a
+    fresh unit of work instead of sharing one session for the process lifetime.
+    """
+    from at_simulation_api.storage.postgres.storage import get_db, session_scope
+
+    scope = session_scope()
+    session = scope.__enter__()
+    # commit, rollback and close talk to the DB, so they run off the event loop
+    try:
+        yield await resolve_dependency(dependency, {get_db: session})
+    except BaseException:
+        if not await asyncio.to_thread(scope.__exit__, *sys.exc_info()):
+            raise
+    else:
+        await asyncio.to_thread(scope.__exit__, None, None, None)
@@ -1,26 +1,36 @@
-from typing import List, Protocol
+from typing import AsyncIterator, Callable, List, Optional, Protocol, TypeVar
 
 from at_simulation_api.client.auth_client import AuthClient
-from at_simulation_api.repository.minio.models.models import MinioFile
 from at_simulation_api.repository.model.models.models import ModelMetaDB
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
 from at_simulation_api.service.model.service import ModelService
 from at_simulation_api.service.processor.models.models import Process
 from at_simulation_api.service.processor.service import ProcessorService
+from at_simulation_api.service.translator.models.models import BatchTranslationItem
 from at_simulation_api.service.translator.service import TranslatorService
+from at_simulation_api.worker.executor import WorkerExecutor
+
+T = TypeVar("T")
 
 
 class ITranslatorService(Protocol):
-    def get_translated_files(self, user_id: int) -> List[MinioFile]: ...
+    def get_translated_files(
+        self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TranslatedFilesPage: ...
+
+    async def translate_models(
+        self, model_ids: List[int], user_id: int, file_name: str
+    ) -> AsyncIterator[BatchTranslationItem]: ...
 
 
-_: ITranslatorService = TranslatorService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: ITranslatorService = TranslatorService(..., ..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IModelService(Protocol):
     def get_models(self, user_id: int) -> List[ModelMetaDB]: ...
 
 
-_: IModelService = ModelService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IModelService = ModelService(..., ..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IAuthClient(Protocol):
@@ -31,15 +41,22 @@ _: IAuthClient = AuthClient(...)  # type: ignore[arg-type, reportArgumentType]
 
 
 class IProcessorService(Protocol):
-    def create_process(
+    async def create_process(
         self, user_id: int, file_uuid: str, process_name: str
     ) -> Process: ...
 
     async def run_tick(self, user_id: int, process_id: str) -> dict: ...
 
-    def kill_process(self, user_id: int, process_id: str) -> Process: ...
+    async def kill_process(self, user_id: int, process_id: str) -> Process: ...
 
     def get_processes(self, user_id: int) -> List[Process]: ...
 
 
-_: IProcessorService = ProcessorService(..., ...)  # type: ignore[arg-type, reportArgumentType]
+_: IProcessorService = ProcessorService(..., ..., ..., ...)  # type: ignore[arg-type, reportArgumentType]
+
+
+class IWorkerExecutor(Protocol):
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T: ...
+
+
+_: IWorkerExecutor = WorkerExecutor(..., ...)  # type: ignore[arg-type, reportArgumentType]
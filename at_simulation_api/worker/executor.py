@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from at_simulation_api.worker.models.models import WorkerStatsDict
+
+T = TypeVar("T")
+
+
+class WorkerExecutor:
+    """
+    Runs the blocking service calls of worker methods in a thread pool with at
+    most ``max_concurrent_calls`` in flight, so one slow call does not stall
+    the event loop and the other queued messages. Counters are only updated
+    on the event loop.
+    """
+
+    def __init__(self, thread_pool_size: int, max_concurrent_calls: int):
+        self._thread_pool_size = thread_pool_size
+        self._max_concurrent_calls = max_concurrent_calls
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        self._queued += 1
+        started = False
+        try:
+            async with self._get_semaphore():
+                self._queued -= 1
+                started = True
+                self._in_flight += 1
+                try:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self._get_pool(), partial(func, *args, **kwargs)
+                    )
+                except Exception:
+                    self._failed += 1
+                    raise
+                finally:
+                    self._in_flight -= 1
+        finally:
+            if not started:
+                self._queued -= 1
+
+        self._completed += 1
+        return result
+
+    def get_stats(self) -> WorkerStatsDict:
+        return WorkerStatsDict(
+            queued=self._queued,
+            in_flight=self._in_flight,
+            max_concurrent_calls=self._max_concurrent_calls,
+            completed=self._completed,
+            failed=self._failed,
+        )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._thread_pool_size,
+                thread_name_prefix="at_simulation_worker",
+            )
+        return self._pool
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_calls)
+        return self._semaphore
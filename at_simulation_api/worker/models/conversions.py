@@ -3,13 +3,17 @@ from typing import List, Union
 
 from at_simulation_api.repository.minio.models.models import MinioFile
 from at_simulation_api.repository.model.models.models import ModelMetaDB
+from at_simulation_api.service.file_index.models.models import TranslatedFilesPage
 from at_simulation_api.service.processor.models.models import Process
+from at_simulation_api.service.translator.models.models import BatchTranslationItem
 from at_simulation_api.worker.models.models import (
     ProcessDict,
     ProcessStatusEnum,
     ResourceDict,
     TickDict,
     TranslatedFileDict,
+    TranslatedFilesPageDict,
+    TranslationResultDict,
     UsageIrregularEventDict,
     UsageOperationDict,
     UsageRuleDict,
@@ -37,6 +41,27 @@ def to_TranslatedFileDicts(
     return enriched_files
 
 
+def to_TranslatedFilesPageDict(
+    page: TranslatedFilesPage,
+    models: List[ModelMetaDB],
+) -> TranslatedFilesPageDict:
+    return {
+        "files": to_TranslatedFileDicts(page.files, models),
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+    }
+
+
+def to_TranslationResultDict(item: BatchTranslationItem) -> TranslationResultDict:
+    return {
+        "model_id": item.model_id,
+        "file_id": item.result.file_name if item.result else None,
+        "stage": item.result.stage.value if item.result else None,
+        "translate_logs": item.result.translate_logs if item.result else None,
+        "error": item.error,
+    }
+
+
 def to_ProcessDict(process: Process) -> ProcessDict:
     return {
         "id": process.process_id,
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, TypedDict, Union
+from typing import Any, Dict, List, Optional, TypedDict, Union
 
 
 class TranslatedFileDict(TypedDict):
@@ -12,6 +12,20 @@ class TranslatedFileDict(TypedDict):
     model_name: str
 
 
+class TranslatedFilesPageDict(TypedDict):
+    files: List[TranslatedFileDict]
+    total: int
+    next_cursor: Optional[str]
+
+
+class TranslationResultDict(TypedDict):
+    model_id: int
+    file_id: Optional[str]
+    stage: Optional[str]
+    translate_logs: Optional[str]
+    error: Optional[Dict[str, Any]]
+
+
 class ProcessStatusEnum(str, Enum):
     PAUSE = "PAUSE"
     RUNNING = "RUNNING"
@@ -54,3 +68,11 @@ class TickDict(TypedDict):
     current_state: ProcessStatusEnum
     resources: List[ResourceDict]
     usages: List[Union[UsageIrregularEventDict, UsageOperationDict, UsageRuleDict]]
+
+
+class WorkerStatsDict(TypedDict):
+    queued: int
+    in_flight: int
+    max_concurrent_calls: int
+    completed: int
+    failed: int
@@ -1,13 +1,16 @@
-from typing import List
+from typing import AsyncContextManager, Callable, List, Optional
 
 from at_queue.core.at_component import ATComponent
 from at_queue.utils.decorators import authorized_method
 
+from at_simulation_api.config.translator import TranslatorStore
+from at_simulation_api.repository.minio.models.models import MinioFile
 from at_simulation_api.worker.dependencies import (
     IAuthClient,
     IModelService,
     IProcessorService,
     ITranslatorService,
+    IWorkerExecutor,
 )
 from at_simulation_api.worker.models.conversions import (
     TranslatedFileDict,
@@ -15,8 +18,15 @@ from at_simulation_api.worker.models.conversions import (
     to_ProcessDicts,
     to_TickDict,
     to_TranslatedFileDicts,
+    to_TranslatedFilesPageDict,
+    to_TranslationResultDict,
+)
+from at_simulation_api.worker.models.models import (
+    ProcessDict,
+    TickDict,
+    TranslatedFilesPageDict,
+    TranslationResultDict,
 )
-from at_simulation_api.worker.models.models import ProcessDict, TickDict
 
 
 class ATSimulationWorker(ATComponent):
@@ -24,30 +34,81 @@ class ATSimulationWorker(ATComponent):
         self,
         connection_parameters,
         auth_client: IAuthClient,
-        model_service: IModelService,
-        translator_service: ITranslatorService,
+        model_service_scope: Callable[[], AsyncContextManager[IModelService]],
+        translator_service_scope: Callable[
+            [], AsyncContextManager[ITranslatorService]
+        ],
         processor_service: IProcessorService,
+        executor: IWorkerExecutor,
     ):
         super().__init__(connection_parameters=connection_parameters)
         self._auth_client = auth_client
-        self._model_service = model_service
-        self._translator_service = translator_service
+        # DB-backed services are resolved per call, each with its own session
+        self._model_service_scope = model_service_scope
+        self._translator_service_scope = translator_service_scope
         self._processor_service = processor_service
+        self._executor = executor
 
     @authorized_method
     async def get_translated_files(self, auth_token: str) -> List[TranslatedFileDict]:
         user_id = await self._auth_client.verify_token(auth_token)
-        models = self._model_service.get_models(user_id)
-        files = self._translator_service.get_translated_files(user_id)
+        async with self._model_service_scope() as model_service:
+            models = await self._executor.run(model_service.get_models, user_id)
+        # kept for existing callers: walks every page, newest first
+        files: List[MinioFile] = []
+        cursor: Optional[str] = None
+        async with self._translator_service_scope() as translator_service:
+            while True:
+                page = await self._executor.run(
+                    translator_service.get_translated_files,
+                    user_id,
+                    TranslatorStore.get_translator_config().max_files_page_size,
+                    cursor,
+                )
+                files.extend(page.files)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
         return to_TranslatedFileDicts(files, models)
 
+    @authorized_method
+    async def get_translated_files_page(
+        self,
+        auth_token: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TranslatedFilesPageDict:
+        user_id = await self._auth_client.verify_token(auth_token)
+        async with self._model_service_scope() as model_service:
+            models = await self._executor.run(model_service.get_models, user_id)
+        async with self._translator_service_scope() as translator_service:
+            page = await self._executor.run(
+                translator_service.get_translated_files, user_id, limit, cursor
+            )
+        return to_TranslatedFilesPageDict(page, models)
+
+    @authorized_method
+    async def translate_models(
+        self, auth_token: str, model_ids: List[int], file_name: str
+    ) -> List[TranslationResultDict]:
+        user_id = await self._auth_client.verify_token(auth_token)
+        # models are loaded before the scope closes, so builds do not hold a
+        # DB connection
+        async with self._translator_service_scope() as translator_service:
+            items = await translator_service.translate_models(
+                model_ids, user_id, file_name
+            )
+        return [to_TranslationResultDict(item) async for item in items]
+
     @authorized_method
     async def create_process(
         self, auth_token: str, file_id: str, process_name: str
     ) -> ProcessDict:
         user_id = await self._auth_client.verify_token(auth_token)
         return to_ProcessDict(
-            self._processor_service.create_process(user_id, file_id, process_name)
+            await self._processor_service.create_process(
+                user_id, file_id, process_name
+            )
         )
 
     @authorized_method
@@ -58,9 +119,13 @@ class ATSimulationWorker(ATComponent):
     @authorized_method
     async def kill_process(self, auth_token: str, process_id: str) -> ProcessDict:
         user_id = await self._auth_client.verify_token(auth_token)
-        return to_ProcessDict(self._processor_service.kill_process(user_id, process_id))
+        return to_ProcessDict(
+            await self._processor_service.kill_process(user_id, process_id)
+        )
 
     @authorized_method
     async def get_processes(self, auth_token: str) -> List[ProcessDict]:
         user_id = await self._auth_client.verify_token(auth_token)
-        return to_ProcessDicts(self._processor_service.get_processes(user_id))
+        return to_ProcessDicts(
+            await self._executor.run(self._processor_service.get_processes, user_id)
+        )
@@ -10,6 +10,7 @@ from at_simulation_api.schema.imports import *
 from at_simulation_api.schema.model import *
 from at_simulation_api.schema.resource import *
 from at_simulation_api.schema.template import *
+from at_simulation_api.schema.translated_file import *
 from at_simulation_api.schema.visio import *
 
 # this is the Alembic Config object, which provides
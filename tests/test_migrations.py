@@ -0,0 +1,105 @@
+import os
+import subprocess
+import uuid
+from typing import Iterator
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import Engine, create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from at_simulation_api.config.postgres import DatabaseConfig
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "migrations")
+
+FOREIGN_KEY_INDEXES_REVISION = "089b18b6680f"
+
+# table -> indexes added by the foreign_key_indexes revision
+FOREIGN_KEY_INDEXES = {
+    "functions": {"ix_functions_model_id"},
+    "imports": {"ix_imports_model_id"},
+    "nodes": {"ix_nodes_model_id", "ix_nodes_object_table_object_id"},
+    "resource_types": {"ix_resource_types_model_id"},
+    "templates": {"ix_templates_model_id_type"},
+    "edges": {"ix_edges_from_node", "ix_edges_model_id", "ix_edges_to_node"},
+    "function_parameters": {"ix_function_parameters_function_id"},
+    "packages": {"ix_packages_import_id"},
+    "relevant_resources": {
+        "ix_relevant_resources_resource_type_id",
+        "ix_relevant_resources_template_id",
+    },
+    "resource_type_attributes": {"ix_resource_type_attributes_resource_type_id"},
+    "resources": {"ix_resources_model_id", "ix_resources_resource_type_id"},
+    "template_usages": {
+        "ix_template_usages_model_id",
+        "ix_template_usages_template_id",
+    },
+    "resource_attributes": {
+        "ix_resource_attributes_resource_id",
+        "ix_resource_attributes_rta_id",
+    },
+    "template_usage_args": {
+        "ix_template_usage_args_relevant_resource_id",
+        "ix_template_usage_args_resource_id",
+        "ix_template_usage_args_template_usage_id",
+    },
+}
+
+
+@pytest.fixture
+def scratch_db_name() -> Iterator[str]:
+    """
+    A fresh database on the server from the DB_* settings, dropped afterwards.
+    The migrations use Postgres-only DDL, so there is no SQLite fallback.
+    """
+    try:
+        config = DatabaseConfig()
+    except ValidationError:
+        pytest.skip("DB_* settings are not configured")
+
+    admin_engine = create_engine(config.url, isolation_level="AUTOCOMMIT")
+    name = f"at_simulation_test_{uuid.uuid4().hex}"
+    try:
+        with admin_engine.connect() as connection:
+            connection.execute(text(f'CREATE DATABASE "{name}"'))
+    except OperationalError:
+        admin_engine.dispose()
+        pytest.skip("Postgres from the DB_* settings is not reachable")
+
+    try:
+        yield name
+    finally:
+        with admin_engine.connect() as connection:
+            connection.execute(text(f'DROP DATABASE "{name}" WITH (FORCE)'))
+        admin_engine.dispose()
+
+
+def _alembic(db_name: str, *args: str) -> None:
+    # env.py reads the URL from the DB_* settings, as upgrade_head.sh does
+    subprocess.run(
+        ["alembic", *args],
+        cwd=MIGRATIONS_DIR,
+        env={**os.environ, "DB_NAME": db_name},
+        check=True,
+    )
+
+
+def _get_index_names(engine: Engine, table: str) -> set:
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_foreign_key_indexes_exist_after_upgrade(scratch_db_name):
+    _alembic(scratch_db_name, "upgrade", "head")
+
+    url = DatabaseConfig(DB_NAME=scratch_db_name).url
+    engine = create_engine(url)
+    try:
+        for table, indexes in FOREIGN_KEY_INDEXES.items():
+            assert indexes <= _get_index_names(engine, table), table
+
+        _alembic(scratch_db_name, "downgrade", f"{FOREIGN_KEY_INDEXES_REVISION}-1")
+
+        for table, indexes in FOREIGN_KEY_INDEXES.items():
+            assert not indexes & _get_index_names(engine, table), table
+    finally:
+        engine.dispose()
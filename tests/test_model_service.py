@@ -0,0 +1,199 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from at_simulation_api.repository.editor.function.repository import (
+    FunctionRepository,
+)
+from at_simulation_api.repository.editor.resource.repository import (
+    ResourceRepository,
+)
+from at_simulation_api.repository.editor.template.repository import (
+    TemplateRepository,
+)
+from at_simulation_api.repository.model.repository import ModelRepository
+from at_simulation_api.schema import imports, visio  # noqa: F401
+from at_simulation_api.schema.base import Base
+from at_simulation_api.schema.function import Function, FunctionParameter
+from at_simulation_api.schema.model import Model
+from at_simulation_api.schema.resource import (
+    Resource,
+    ResourceAttribute,
+    ResourceType,
+    ResourceTypeAttribute,
+)
+from at_simulation_api.schema.template import (
+    IrregularEventBody,
+    IrregularEventGenerator,
+    OperationBody,
+    RelevantResource,
+    RuleBody,
+    Template,
+    TemplateUsage,
+    TemplateUsageArgument,
+)
+from at_simulation_api.service.editor.function.service import FunctionService
+from at_simulation_api.service.editor.resource.service import ResourceService
+from at_simulation_api.service.editor.template.service import TemplateService
+from at_simulation_api.service.model.cache import ModelCache
+from at_simulation_api.service.model.service import ModelService
+
+# statements for one model: its meta plus one query per table it reads,
+# independent of how many rows the model has
+_MAX_QUERIES_PER_MODEL = 20
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array(element, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _add_model(session: Session, name: str, size: int) -> int:
+    model = Model(name=name, user_id=1)
+
+    resource_types = []
+    for t in range(size):
+        resource_type = ResourceType(
+            name=f"type{t}",
+            type="CONSTANT",
+            attributes=[
+                ResourceTypeAttribute(name=f"attr{a}", type="INT") for a in range(3)
+            ],
+        )
+        model.resource_types.append(resource_type)
+        resource_types.append(resource_type)
+
+    resources = []
+    for r in range(size * 3):
+        resource_type = resource_types[r % size]
+        resource = Resource(name=f"res{r}", to_be_traced=True)
+        for attribute in resource_type.attributes:
+            resource_attribute = ResourceAttribute(value=r)
+            attribute.resource_attributes.append(resource_attribute)
+            resource.attributes.append(resource_attribute)
+        resource_type.resources.append(resource)
+        model.resources.append(resource)
+        resources.append(resource)
+
+    for k in range(size * 3):
+        kind = ["IRREGULAR_EVENT", "OPERATION", "RULE"][k % 3]
+        template = Template(name=f"tmpl{k}", type=kind)
+        for j in range(2):
+            rel_resource = RelevantResource(name=f"p{j}")
+            resource_types[(k + j) % size].rel_resources.append(rel_resource)
+            template.relevant_resources.append(rel_resource)
+        if kind == "IRREGULAR_EVENT":
+            template.irregular_event_bodies.append(IrregularEventBody(body="x"))
+            template.irregular_event_generators.append(
+                IrregularEventGenerator(type="NORMAL", value=1, dispersion=0.5)
+            )
+        elif kind == "OPERATION":
+            template.operation_bodies.append(
+                OperationBody(condition="x", body_before="x", delay=1, body_after="x")
+            )
+        else:
+            template.rule_bodies.append(RuleBody(condition="x", body="x"))
+        model.templates.append(template)
+
+        usage = TemplateUsage(name=f"usage{k}")
+        for rel_resource in template.relevant_resources:
+            argument = TemplateUsageArgument()
+            rel_resource.template_usage_args.append(argument)
+            resources[k % len(resources)].usage_resources.append(argument)
+            usage.template_usage_args.append(argument)
+        template.template_usages.append(usage)
+        model.template_usages.append(usage)
+
+    for f in range(size):
+        model.functions.append(
+            Function(
+                name=f"fn{f}",
+                ret_type="int",
+                body="return 1",
+                parameters=[FunctionParameter(name="x", type="int")],
+            )
+        )
+
+    session.add(model)
+    session.commit()
+    return model.id
+
+
+def _create_service(session: Session) -> ModelService:
+    model_cache = ModelCache(16)
+    return ModelService(
+        ModelRepository(session),
+        ResourceService(ResourceRepository(session), None, model_cache),
+        TemplateService(TemplateRepository(session), None, model_cache),
+        FunctionService(FunctionRepository(session), None, model_cache),
+        model_cache,
+    )
+
+
+def _count_queries(engine: Engine, load) -> int:
+    queries = []
+
+    def count(*args, **kwargs):
+        queries.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with Session(engine) as session:
+            load(_create_service(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return len(queries)
+
+
+def test_get_model_query_count_does_not_grow_with_model(engine):
+    with Session(engine) as session:
+        small_id = _add_model(session, "small", 2)
+        large_id = _add_model(session, "large", 20)
+
+    small = _count_queries(engine, lambda service: service.get_model(small_id, 1))
+    large = _count_queries(engine, lambda service: service.get_model(large_id, 1))
+
+    assert large == small
+    assert large <= _MAX_QUERIES_PER_MODEL
+
+
+def test_get_models_by_ids_query_count_is_bounded(engine):
+    with Session(engine) as session:
+        model_ids = [_add_model(session, f"model{i}", 10) for i in range(3)]
+
+    queries = _count_queries(
+        engine, lambda service: service.get_models_by_ids(model_ids, 1)
+    )
+
+    assert queries <= 1 + len(model_ids) * _MAX_QUERIES_PER_MODEL
+
+
+def test_get_model_returns_all_content(engine):
+    with Session(engine) as session:
+        model_id = _add_model(session, "model", 4)
+
+    with Session(engine) as session:
+        model = _create_service(session).get_model(model_id, 1)
+
+    assert len(model.resource_types) == 4
+    assert all(len(rt.attributes) == 3 for rt in model.resource_types)
+    assert len(model.resources) == 12
+    assert all(len(r.attributes) == 3 for r in model.resources)
+    assert len(model.irregular_events) == len(model.operations) == 4
+    assert len(model.rules) == 4
+    assert all(len(rule.meta.rel_resources) == 2 for rule in model.rules)
+    assert len(model.template_usages) == 12
+    assert all(len(u.arguments) == 2 for u in model.template_usages)
+    assert len(model.functions) == 4
@@ -0,0 +1,80 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from at_simulation_api.delivery.core.middleware.response import (
+    ResponseHelper,
+    ResponseMiddleware,
+)
+
+
+def _create_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ResponseMiddleware)
+
+    @app.get("/object")
+    def get_object():
+        return {"a": 1}
+
+    @app.get("/list")
+    def get_list():
+        return [{"a": 1}, {"a": 2}]
+
+    @app.get("/stream")
+    def get_stream():
+        async def items():
+            for i in range(3):
+                yield json.dumps({"i": i}).encode()
+
+        return StreamingResponse(
+            items(),
+            media_type="application/json",
+            headers={ResponseHelper.STREAM_ARRAY_HEADER: "1"},
+        )
+
+    @app.get("/empty-stream")
+    def get_empty_stream():
+        async def items():
+            return
+            yield
+
+        return StreamingResponse(
+            items(),
+            media_type="application/json",
+            headers={ResponseHelper.STREAM_ARRAY_HEADER: "1"},
+        )
+
+    return TestClient(app)
+
+
+def test_plain_endpoint_envelope_is_unchanged():
+    response = _create_client().get("/object")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status_code": 200,
+        "is_error": False,
+        "error_message": "Success",
+        "data": {"a": 1},
+    }
+
+
+def test_list_endpoint_is_not_wrapped_again():
+    response = _create_client().get("/list")
+
+    assert response.json()["data"] == [{"a": 1}, {"a": 2}]
+
+
+def test_opted_in_stream_is_wrapped_in_array():
+    response = _create_client().get("/stream")
+
+    assert response.json()["data"] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert ResponseHelper.STREAM_ARRAY_HEADER not in response.headers
+
+
+def test_opted_in_empty_stream_is_empty_array():
+    response = _create_client().get("/empty-stream")
+
+    assert response.json()["data"] == []
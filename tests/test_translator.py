@@ -0,0 +1,315 @@
+import hashlib
+import time
+
+from at_simulation_api.repository.editor.function.models.models import (
+    FunctionDB,
+    FunctionParameterDB,
+)
+from at_simulation_api.repository.editor.resource.models.models import (
+    ResourceAttributeDB,
+    ResourceDB,
+    ResourceTypeAttributeDB,
+    ResourceTypeDB,
+)
+from at_simulation_api.repository.editor.template.models.models import (
+    IrregularEventBodyDB,
+    IrregularEventDB,
+    IrregularEventGeneratorDB,
+    OperationBodyDB,
+    OperationDB,
+    RelevantResourceDB,
+    RuleBodyDB,
+    RuleDB,
+    TemplateMetaDB,
+    TemplateUsageArgumentDB,
+    TemplateUsageDB,
+)
+from at_simulation_api.repository.model.models.models import ModelMetaDB
+from at_simulation_api.service.model.models.models import Model
+from at_simulation_api.service.translator.context import TranslationContext
+from at_simulation_api.service.translator.main import trnsl_model
+from at_simulation_api.service.translator.memo import FragmentMemo
+from at_simulation_api.service.translator.utils import (
+    _get_param_pattern,
+    preprocess_template_code,
+)
+
+# output of trnsl_model for _build_model() before the translator used
+# precomputed lookups, rendered on the baseline tree
+_BASELINE_LENGTH = 209244
+_BASELINE_SHA256 = "5a3e437eb33634978d01f99bd00583b187388710b0b76951c436af4b2cd829d8"
+
+_ATTRIBUTE_TYPES = ["INT", "BOOL", "FLOAT", "ENUM", "INT"]
+_ATTRIBUTE_VALUES = {"INT": 3, "BOOL": True, "FLOAT": 1.5, "ENUM": "a"}
+_TEMPLATE_TYPES = ["OPERATION", "RULE", "IRREGULAR_EVENT"]
+_TEMPLATE_CODE = "if p0.attr0 > p1.attr0 && p2.attr1 { p0.attr0 = p0.attr0 + 1 }"
+
+
+def _build_model(
+    n_types: int = 20,
+    n_resources: int = 500,
+    n_templates: int = 60,
+    n_usages: int = 500,
+    n_functions: int = 20,
+) -> Model:
+    resource_types = []
+    attribute_id = 0
+    for t in range(n_types):
+        attributes = []
+        for a, attribute_type in enumerate(_ATTRIBUTE_TYPES):
+            attribute_id += 1
+            attributes.append(
+                ResourceTypeAttributeDB(
+                    id=attribute_id,
+                    name=f"attr{a}",
+                    type=attribute_type,
+                    default_value=None,
+                    enum_values_set=["a", "b"] if attribute_type == "ENUM" else None,
+                    resource_type_id=t + 1,
+                )
+            )
+        resource_types.append(
+            ResourceTypeDB(
+                id=t + 1,
+                name=f"type{t}",
+                type="CONSTANT",
+                model_id=1,
+                attributes=attributes,
+            )
+        )
+
+    resources = []
+    resource_attribute_id = 0
+    for r in range(n_resources):
+        resource_type = resource_types[r % n_types]
+        attributes = []
+        for attribute in resource_type.attributes:
+            resource_attribute_id += 1
+            attributes.append(
+                ResourceAttributeDB(
+                    id=resource_attribute_id,
+                    rta_id=attribute.id,
+                    resource_id=r + 1,
+                    value=_ATTRIBUTE_VALUES[attribute.type],
+                )
+            )
+        resources.append(
+            ResourceDB(
+                id=r + 1,
+                name=f"res{r}",
+                to_be_traced=True,
+                attributes=attributes,
+                model_id=1,
+                resource_type_id=resource_type.id,
+            )
+        )
+
+    operations, rules, irregular_events = [], [], []
+    metas = {}
+    rel_resource_id = 0
+    for k in range(n_templates):
+        rel_resources = []
+        for j in range(3):
+            rel_resource_id += 1
+            rel_resources.append(
+                RelevantResourceDB(
+                    id=rel_resource_id,
+                    name=f"p{j}",
+                    template_id=k + 1,
+                    resource_type_id=resource_types[(k + j) % n_types].id,
+                )
+            )
+        kind = k % 3
+        meta = TemplateMetaDB(
+            id=k + 1,
+            name=f"tmpl{k}",
+            type=_TEMPLATE_TYPES[kind],
+            rel_resources=rel_resources,
+            model_id=1,
+        )
+        metas[meta.id] = meta
+        if kind == 0:
+            operations.append(
+                OperationDB(
+                    meta=meta,
+                    body=OperationBodyDB(
+                        condition="p0.attr0 > 1",
+                        body_before=_TEMPLATE_CODE,
+                        delay=1,
+                        body_after=_TEMPLATE_CODE,
+                        template_id=k + 1,
+                    ),
+                )
+            )
+        elif kind == 1:
+            rules.append(
+                RuleDB(
+                    meta=meta,
+                    body=RuleBodyDB(
+                        condition="p0.attr0 > 1",
+                        body=_TEMPLATE_CODE,
+                        template_id=k + 1,
+                    ),
+                )
+            )
+        else:
+            irregular_events.append(
+                IrregularEventDB(
+                    meta=meta,
+                    generator=IrregularEventGeneratorDB(
+                        type="NORMAL", value=1, dispersion=0.5, template_id=k + 1
+                    ),
+                    body=IrregularEventBodyDB(
+                        body=_TEMPLATE_CODE, template_id=k + 1
+                    ),
+                )
+            )
+
+    template_usages = []
+    argument_id = 0
+    for u in range(n_usages):
+        meta = metas[u % n_templates + 1]
+        arguments = []
+        for rel_resource in meta.rel_resources:
+            argument_id += 1
+            # spread over the whole list so lookups by id cannot stop early
+            resource = resources[
+                (u * 7919) % (n_resources // n_types) * n_types
+                + rel_resource.resource_type_id
+                - 1
+            ]
+            arguments.append(
+                TemplateUsageArgumentDB(
+                    id=argument_id,
+                    relevant_resource_id=rel_resource.id,
+                    template_usage_id=u + 1,
+                    resource_id=resource.id,
+                )
+            )
+        template_usages.append(
+            TemplateUsageDB(
+                id=u + 1,
+                name=f"usage{u}",
+                template_id=meta.id,
+                arguments=arguments,
+                model_id=1,
+            )
+        )
+
+    functions = [
+        FunctionDB(
+            id=i + 1,
+            name=f"fn{i}",
+            ret_type="int",
+            body="return 1",
+            model_id=1,
+            params=[
+                FunctionParameterDB(id=i + 1, name="x", type="int", function_id=i + 1)
+            ],
+        )
+        for i in range(n_functions)
+    ]
+
+    return Model(
+        meta=ModelMetaDB(id=1, name="m", user_id=1),
+        resource_types=resource_types,
+        resources=resources,
+        irregular_events=irregular_events,
+        operations=operations,
+        rules=rules,
+        template_usages=template_usages,
+        functions=functions,
+    )
+
+
+def test_large_model_output_matches_baseline():
+    rendered = trnsl_model(_build_model())
+
+    assert len(rendered) == _BASELINE_LENGTH
+    assert hashlib.sha256(rendered.encode()).hexdigest() == _BASELINE_SHA256
+
+
+def test_large_model_translates_in_linear_time():
+    model = _build_model(n_resources=8000, n_usages=8000)
+
+    started_at = time.perf_counter()
+    trnsl_model(model)
+    elapsed = time.perf_counter() - started_at
+
+    # about 1s with the lookups by id, the linear scans took about 9s
+    assert elapsed < 4.0
+
+
+def test_fragment_memo_returns_cached_fragment_for_same_content():
+    memo = FragmentMemo(max_size=10, version="v1")
+    renders = []
+
+    def render() -> str:
+        renders.append(1)
+        return f"fragment{len(renders)}"
+
+    first = memo.render("resource", {"id": 1, "name": "a"}, render)
+    second = memo.render("resource", {"id": 1, "name": "a"}, render)
+
+    assert first == second == "fragment1"
+    assert len(renders) == 1
+
+
+def test_fragment_memo_renders_again_for_changed_content():
+    memo = FragmentMemo(max_size=10, version="v1")
+
+    first = memo.render("resource", {"id": 1, "name": "a"}, lambda: "a")
+    changed = memo.render("resource", {"id": 1, "name": "b"}, lambda: "b")
+    other_kind = memo.render("rule", {"id": 1, "name": "a"}, lambda: "rule")
+
+    assert (first, changed, other_kind) == ("a", "b", "rule")
+    assert FragmentMemo(10, "v2").render("resource", {"id": 1}, lambda: "v2") == "v2"
+
+
+def test_fragment_memo_drops_least_recently_used():
+    memo = FragmentMemo(max_size=2, version="v1")
+    memo.render("resource", 1, lambda: "one")
+    memo.render("resource", 2, lambda: "two")
+    memo.render("resource", 1, lambda: "unused")
+    memo.render("resource", 3, lambda: "three")
+
+    assert memo.render("resource", 1, lambda: "again") == "one"
+    assert memo.render("resource", 2, lambda: "again") == "again"
+
+
+def test_translation_context_lookups():
+    model = _build_model(n_types=3, n_resources=6, n_templates=3, n_usages=3)
+    context = TranslationContext.from_model(model)
+    operation = model.operations[0].meta
+    rule = model.rules[0].meta
+
+    assert context.get_resource_type(2) is model.resource_types[1]
+    assert context.get_resource(6) is model.resources[5]
+    assert context.get_template(operation.id) is operation
+    assert context.get_template(rule.id) is rule
+    assert context.get_resource(100) is None
+
+    rel_resource = operation.rel_resources[1]
+    assert context.get_rel_resource(operation.id, rel_resource.id) is rel_resource
+    # a relevant resource only resolves under the template it belongs to
+    assert context.get_rel_resource(rule.id, rel_resource.id) is None
+
+    assert context.get_rel_resources_info(operation) == {
+        rr.id: model.resource_types[rr.resource_type_id - 1]
+        for rr in operation.rel_resources
+    }
+
+
+def test_preprocess_template_code_prefixes_params():
+    code = 'p0.attr0 = p01.attr0 + x.p0 + "p0"'
+
+    assert preprocess_template_code(code, ["p0", "p01"]) == (
+        't.p0.attr0 = t.p01.attr0 + x.p0 + "p0"'
+    )
+    # the same params in another order reuse the compiled pattern
+    hits = _get_param_pattern.cache_info().hits
+    assert preprocess_template_code(code, ["p01", "p0"]) == (
+        't.p0.attr0 = t.p01.attr0 + x.p0 + "p0"'
+    )
+    assert _get_param_pattern.cache_info().hits == hits + 1
+    assert preprocess_template_code(code, []) == code